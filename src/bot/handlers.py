@@ -5,7 +5,7 @@ from aiogram.filters import Command, CommandStart
 from aiogram.fsm.context import FSMContext
 from aiogram.fsm.state import State, StatesGroup
 from src.storage import (
-    AsyncSessionLocal, CompanyRepository, NotificationRepository,
+    get_uow, CompanyRepository, NotificationRepository,
     WorksectionCaseRepository, CourtCaseRepository, UserSubscriptionRepository,
     UserSettingsRepository, CaseSubscriptionRepository, BotUserRepository
 )
@@ -24,6 +24,7 @@ from src.services.contractor_formatter import ContractorFormatter, PersonDataPar
 from src.utils import normalize_case_number
 from src.config import settings
 from datetime import datetime
+from typing import Optional, Tuple
 import logging
 
 logger = logging.getLogger(__name__)
@@ -115,7 +116,7 @@ def identify_input_type(text: str) -> tuple:
 async def cmd_start(message: Message):
     """Головне меню"""
     # Register / update user in DB
-    async with AsyncSessionLocal() as session:
+    async with get_uow() as session:
         repo = BotUserRepository(session)
         user = message.from_user
         await repo.get_or_create(
@@ -260,7 +261,8 @@ async def process_edrpou(message: Message, state: FSMContext):
     
     edrpou = format_edrpou(edrpou)
     
-    async with AsyncSessionLocal() as session:
+    already_subscribed = False
+    async with get_uow() as session:
         repo = CompanyRepository(session)
         
         existing = await repo.get_company(edrpou)
@@ -270,42 +272,46 @@ async def process_edrpou(message: Message, state: FSMContext):
             user_sub = await user_sub_repo.get_subscription(message.from_user.id, edrpou)
             
             if user_sub and user_sub.is_active:
-                await message.answer(
-                    f"ℹ️ Ви вже підписані на <code>{edrpou}</code>",
-                    reply_markup=back_to_main_keyboard(),
-                    parse_mode="HTML"
-                )
+                already_subscribed = True
             else:
                 # Add user subscription
                 await user_sub_repo.subscribe(message.from_user.id, edrpou)
                 
                 if not existing.is_active:
                     await repo.activate_company(edrpou)
-                
-                name = existing.company_name or "—"
-                await message.answer(
-                    f"✅ <b>Підписку додано!</b>\n\n"
-                    f"├ ЄДРПОУ: <code>{edrpou}</code>\n"
-                    f"├ Назва: {name}\n"
-                    f"└ 🔔 Сповіщення: увімкнено",
-                    reply_markup=back_to_main_keyboard(),
-                    parse_mode="HTML"
-                )
-                logger.info(f"User {message.from_user.id} subscribed to existing company {edrpou}")
-            
-            await state.clear()
-            return
+            name = existing.company_name or "—"
+    
+    if existing:
+        if already_subscribed:
+            await message.answer(
+                f"ℹ️ Ви вже підписані на <code>{edrpou}</code>",
+                reply_markup=back_to_main_keyboard(),
+                parse_mode="HTML"
+            )
+        else:
+            await message.answer(
+                f"✅ <b>Підписку додано!</b>\n\n"
+                f"├ ЄДРПОУ: <code>{edrpou}</code>\n"
+                f"├ Назва: {name}\n"
+                f"└ 🔔 Сповіщення: увімкнено",
+                reply_markup=back_to_main_keyboard(),
+                parse_mode="HTML"
+            )
+            logger.info(f"User {message.from_user.id} subscribed to existing company {edrpou}")
         
-        # New company - ask for name
-        await state.update_data(edrpou=edrpou)
-        await state.set_state(AddCompanyStates.waiting_for_name)
-        await message.answer(
-            f"✅ ЄДРПОУ: <code>{edrpou}</code>\n\n"
-            "Компанія нова в системі.\n"
-            "Введіть назву компанії:",
-            reply_markup=cancel_keyboard(),
-            parse_mode="HTML"
-        )
+        await state.clear()
+        return
+    
+    # New company - ask for name
+    await state.update_data(edrpou=edrpou)
+    await state.set_state(AddCompanyStates.waiting_for_name)
+    await message.answer(
+        f"✅ ЄДРПОУ: <code>{edrpou}</code>\n\n"
+        "Компанія нова в системі.\n"
+        "Введіть назву компанії:",
+        reply_markup=cancel_keyboard(),
+        parse_mode="HTML"
+    )
 
 
 @router.message(AddCompanyStates.waiting_for_name)
@@ -315,7 +321,7 @@ async def process_company_name(message: Message, state: FSMContext):
     edrpou = data.get('edrpou')
     company_name = message.text.strip()
     
-    async with AsyncSessionLocal() as session:
+    async with get_uow() as session:
         repo = CompanyRepository(session)
         
         await repo.add_company(
@@ -327,34 +333,34 @@ async def process_company_name(message: Message, state: FSMContext):
         # Create user subscription
         user_sub_repo = UserSubscriptionRepository(session)
         await user_sub_repo.subscribe(message.from_user.id, edrpou)
-        
-        # Create OpenDataBot subscription
-        odb_status = "✅"
-        try:
-            odb = OpenDataBotClient()
-            # ODB API strips leading zeros, so we need to normalize
-            odb_key = edrpou.lstrip('0') or edrpou
-            existing_subs = await odb.get_subscriptions(subscription_key=odb_key)
-            if not existing_subs:
-                await odb.create_subscription(
-                    subscription_type='company',
-                    subscription_key=odb_key
-                )
-                logger.info(f"OpenDataBot subscription created for {edrpou}")
-        except Exception as odb_err:
-            logger.error(f"Failed to create ODB subscription for {edrpou}: {odb_err}")
-            odb_status = "❌"
-        
-        await message.answer(
-            f"✅ <b>Компанію додано!</b>\n\n"
-            f"├ ЄДРПОУ: <code>{edrpou}</code>\n"
-            f"├ Назва: {company_name}\n"
-            f"├ OpenDataBot: {odb_status}\n"
-            f"└ 🔔 Сповіщення: увімкнено",
-            reply_markup=back_to_main_keyboard(),
-            parse_mode="HTML"
-        )
-        logger.info(f"Company added: {edrpou} by user {message.from_user.id}")
+    
+    # Create OpenDataBot subscription
+    odb_status = "✅"
+    try:
+        odb = OpenDataBotClient()
+        # ODB API strips leading zeros, so we need to normalize
+        odb_key = edrpou.lstrip('0') or edrpou
+        existing_subs = await odb.get_subscriptions(subscription_key=odb_key)
+        if not existing_subs:
+            await odb.create_subscription(
+                subscription_type='company',
+                subscription_key=odb_key
+            )
+            logger.info(f"OpenDataBot subscription created for {edrpou}")
+    except Exception as odb_err:
+        logger.error(f"Failed to create ODB subscription for {edrpou}: {odb_err}")
+        odb_status = "❌"
+    
+    await message.answer(
+        f"✅ <b>Компанію додано!</b>\n\n"
+        f"├ ЄДРПОУ: <code>{edrpou}</code>\n"
+        f"├ Назва: {company_name}\n"
+        f"├ OpenDataBot: {odb_status}\n"
+        f"└ 🔔 Сповіщення: увімкнено",
+        reply_markup=back_to_main_keyboard(),
+        parse_mode="HTML"
+    )
+    logger.info(f"Company added: {edrpou} by user {message.from_user.id}")
     
     await state.clear()
 
@@ -385,7 +391,8 @@ async def cmd_add_company(message: Message, state: FSMContext):
         await message.answer("❌ Некоректний ЄДРПОУ. Має бути 8 цифр.")
         return
     
-    async with AsyncSessionLocal() as session:
+    already_subscribed = False
+    async with get_uow() as session:
         repo = CompanyRepository(session)
         user_sub_repo = UserSubscriptionRepository(session)
         existing = await repo.get_company(edrpou)
@@ -394,40 +401,45 @@ async def cmd_add_company(message: Message, state: FSMContext):
             # Company exists - add user subscription
             user_sub = await user_sub_repo.get_subscription(message.from_user.id, edrpou)
             if user_sub and user_sub.is_active:
-                await message.answer(
-                    f"ℹ️ Ви вже підписані на <code>{edrpou}</code>",
-                    reply_markup=back_to_main_keyboard(),
-                    parse_mode="HTML"
-                )
+                already_subscribed = True
             else:
                 await user_sub_repo.subscribe(message.from_user.id, edrpou)
-                await message.answer(
-                    f"✅ Підписку на <code>{edrpou}</code> додано!\n└ 🔔 Сповіщення: увімкнено",
-                    reply_markup=back_to_main_keyboard(),
-                    parse_mode="HTML"
-                )
-            return
-        
-        await repo.add_company(edrpou=edrpou, company_name=company_name, user_id=message.from_user.id)
-        await user_sub_repo.subscribe(message.from_user.id, edrpou)
-        
-        # Create OpenDataBot subscription
-        odb_status = "✅"
-        try:
-            odb = OpenDataBotClient()
-            # ODB API strips leading zeros, so we need to normalize
-            odb_key = edrpou.lstrip('0') or edrpou
-            existing_subs = await odb.get_subscriptions(subscription_key=odb_key)
-            if not existing_subs:
-                await odb.create_subscription(subscription_type='company', subscription_key=odb_key)
-        except:
-            odb_status = "❌"
-        
-        await message.answer(
-            f"✅ Компанію <code>{edrpou}</code> додано!\n├ OpenDataBot: {odb_status}\n└ 🔔 Сповіщення: увімкнено",
-            reply_markup=back_to_main_keyboard(),
-            parse_mode="HTML"
-        )
+        else:
+            await repo.add_company(edrpou=edrpou, company_name=company_name, user_id=message.from_user.id)
+            await user_sub_repo.subscribe(message.from_user.id, edrpou)
+    
+    if existing:
+        if already_subscribed:
+            await message.answer(
+                f"ℹ️ Ви вже підписані на <code>{edrpou}</code>",
+                reply_markup=back_to_main_keyboard(),
+                parse_mode="HTML"
+            )
+        else:
+            await message.answer(
+                f"✅ Підписку на <code>{edrpou}</code> додано!\n└ 🔔 Сповіщення: увімкнено",
+                reply_markup=back_to_main_keyboard(),
+                parse_mode="HTML"
+            )
+        return
+    
+    # Create OpenDataBot subscription
+    odb_status = "✅"
+    try:
+        odb = OpenDataBotClient()
+        # ODB API strips leading zeros, so we need to normalize
+        odb_key = edrpou.lstrip('0') or edrpou
+        existing_subs = await odb.get_subscriptions(subscription_key=odb_key)
+        if not existing_subs:
+            await odb.create_subscription(subscription_type='company', subscription_key=odb_key)
+    except:
+        odb_status = "❌"
+    
+    await message.answer(
+        f"✅ Компанію <code>{edrpou}</code> додано!\n├ OpenDataBot: {odb_status}\n└ 🔔 Сповіщення: увімкнено",
+        reply_markup=back_to_main_keyboard(),
+        parse_mode="HTML"
+    )
 
 
 @router.callback_query(F.data == "company:list")
@@ -448,7 +460,7 @@ async def callback_company_list_page(callback: CallbackQuery):
 
 async def _show_admin_company_list(callback: CallbackQuery, page: int = 0):
     """Показати список компаній для адміна з кнопками"""
-    async with AsyncSessionLocal() as session:
+    async with get_uow() as session:
         repo = CompanyRepository(session)
         companies = await repo.get_all_companies()
         
@@ -493,7 +505,7 @@ async def callback_company_view(callback: CallbackQuery):
     
     edrpou = callback.data.split(":")[2]
     
-    async with AsyncSessionLocal() as session:
+    async with get_uow() as session:
         repo = CompanyRepository(session)
         user_sub_repo = UserSubscriptionRepository(session)
         company = await repo.get_company(edrpou)
@@ -544,11 +556,11 @@ async def show_my_subs_page(callback: CallbackQuery, page: int = 0):
     user_id = callback.from_user.id
     per_page = 15
     
-    async with AsyncSessionLocal() as session:
+    async with get_uow() as session:
         user_sub_repo = UserSubscriptionRepository(session)
         company_repo = CompanyRepository(session)
         
-        my_subs = await user_sub_repo.get_user_subscriptions(user_id)
+        my_subs = await user_sub_repo.get_user_edrpous(user_id)
         
         if not my_subs:
             await callback.message.edit_text(
@@ -572,11 +584,12 @@ async def show_my_subs_page(callback: CallbackQuery, page: int = 0):
         text = f"🔔 <b>Мої підписки</b> ({total})\n\n"
         
         subs_data = []  # (edrpou, name) for keyboard
-        for sub in page_subs:
-            company = await company_repo.get_company(sub.edrpou)
+        companies = await company_repo.get_companies_by_edrpous(page_subs)
+        for edrpou in page_subs:
+            company = companies.get(edrpou)
             name = company.company_name if company and company.company_name else "—"
-            text += f"<code>{sub.edrpou}</code> {name}\n"
-            subs_data.append((sub.edrpou, name))
+            text += f"<code>{edrpou}</code> {name}\n"
+            subs_data.append((edrpou, name))
         
         text += "\n<i>Натисніть ❌ щоб відписатися</i>"
         
@@ -621,41 +634,43 @@ async def process_user_subscribe(message: Message, state: FSMContext):
     
     edrpou = format_edrpou(edrpou)
     
-    async with AsyncSessionLocal() as session:
+    already_subscribed = False
+    async with get_uow() as session:
         company_repo = CompanyRepository(session)
         user_sub_repo = UserSubscriptionRepository(session)
         
         company = await company_repo.get_company(edrpou)
-        
-        if not company:
-            await message.answer(
-                f"❌ <b>Компанія <code>{edrpou}</code> не на моніторингу</b>\n\n"
-                "Зверніться до адміністратора для додавання компанії.",
-                reply_markup=back_to_main_keyboard(),
-                parse_mode="HTML"
-            )
-            await state.clear()
-            return
-        
-        existing = await user_sub_repo.get_subscription(message.from_user.id, edrpou)
-        if existing and existing.is_active:
-            await message.answer(
-                f"ℹ️ Ви вже підписані на <code>{edrpou}</code>",
-                reply_markup=back_to_main_keyboard(),
-                parse_mode="HTML"
-            )
-        else:
-            await user_sub_repo.subscribe(message.from_user.id, edrpou)
-            name = company.company_name or "—"
-            await message.answer(
-                f"✅ <b>Підписку додано!</b>\n\n"
-                f"├ ЄДРПОУ: <code>{edrpou}</code>\n"
-                f"├ Назва: {name}\n"
-                f"└ 🔔 Сповіщення: увімкнено",
-                reply_markup=back_to_main_keyboard(),
-                parse_mode="HTML"
-            )
-            logger.info(f"User {message.from_user.id} subscribed to {edrpou}")
+        if company:
+            existing = await user_sub_repo.get_subscription(message.from_user.id, edrpou)
+            if existing and existing.is_active:
+                already_subscribed = True
+            else:
+                await user_sub_repo.subscribe(message.from_user.id, edrpou)
+    
+    if not company:
+        await message.answer(
+            f"❌ <b>Компанія <code>{edrpou}</code> не на моніторингу</b>\n\n"
+            "Зверніться до адміністратора для додавання компанії.",
+            reply_markup=back_to_main_keyboard(),
+            parse_mode="HTML"
+        )
+    elif already_subscribed:
+        await message.answer(
+            f"ℹ️ Ви вже підписані на <code>{edrpou}</code>",
+            reply_markup=back_to_main_keyboard(),
+            parse_mode="HTML"
+        )
+    else:
+        name = company.company_name or "—"
+        await message.answer(
+            f"✅ <b>Підписку додано!</b>\n\n"
+            f"├ ЄДРПОУ: <code>{edrpou}</code>\n"
+            f"├ Назва: {name}\n"
+            f"└ 🔔 Сповіщення: увімкнено",
+            reply_markup=back_to_main_keyboard(),
+            parse_mode="HTML"
+        )
+        logger.info(f"User {message.from_user.id} subscribed to {edrpou}")
     
     await state.clear()
 
@@ -665,7 +680,7 @@ async def callback_unsub_company(callback: CallbackQuery):
     """Підтвердження відписки від компанії"""
     edrpou = callback.data.split(":")[2]
     
-    async with AsyncSessionLocal() as session:
+    async with get_uow() as session:
         company_repo = CompanyRepository(session)
         company = await company_repo.get_company(edrpou)
         name = company.company_name if company and company.company_name else edrpou
@@ -686,23 +701,23 @@ async def callback_confirm_unsub(callback: CallbackQuery):
     """Підтвердження відписки"""
     edrpou = callback.data.split(":")[2]
     
-    async with AsyncSessionLocal() as session:
+    async with get_uow() as session:
         user_sub_repo = UserSubscriptionRepository(session)
         success = await user_sub_repo.unsubscribe(callback.from_user.id, edrpou)
-        
-        if success:
-            await callback.message.edit_text(
-                f"✅ Ви відписалися від <code>{edrpou}</code>.",
-                reply_markup=back_to_main_keyboard(),
-                parse_mode="HTML"
-            )
-            logger.info(f"User {callback.from_user.id} unsubscribed from {edrpou}")
-        else:
-            await callback.message.edit_text(
-                f"❌ Підписку на <code>{edrpou}</code> не знайдено.",
-                reply_markup=back_to_main_keyboard(),
-                parse_mode="HTML"
-            )
+    
+    if success:
+        await callback.message.edit_text(
+            f"✅ Ви відписалися від <code>{edrpou}</code>.",
+            reply_markup=back_to_main_keyboard(),
+            parse_mode="HTML"
+        )
+        logger.info(f"User {callback.from_user.id} unsubscribed from {edrpou}")
+    else:
+        await callback.message.edit_text(
+            f"❌ Підписку на <code>{edrpou}</code> не знайдено.",
+            reply_markup=back_to_main_keyboard(),
+            parse_mode="HTML"
+        )
     await callback.answer()
 
 
@@ -718,12 +733,12 @@ async def callback_odb_status(callback: CallbackQuery):
         odb = OpenDataBotClient()
         subs = await odb.get_subscriptions()
         
-        async with AsyncSessionLocal() as session:
+        async with get_uow() as session:
             company_repo = CompanyRepository(session)
             user_sub_repo = UserSubscriptionRepository(session)
             
             local_companies = await company_repo.get_all_companies()
-            my_subs = await user_sub_repo.get_user_subscriptions(callback.from_user.id)
+            my_subs = await user_sub_repo.get_user_edrpous(callback.from_user.id)
         
         # ODB strips leading zeros, so normalize for comparison
         odb_keys = {s.get('subscriptionKey', '').lstrip('0') for s in subs}
@@ -792,23 +807,23 @@ async def callback_confirm_delete(callback: CallbackQuery):
         return
     edrpou = callback.data.split(":")[2]
     
-    async with AsyncSessionLocal() as session:
+    async with get_uow() as session:
         repo = CompanyRepository(session)
         success = await repo.delete_company(edrpou)
-        
-        if success:
-            await callback.message.edit_text(
-                f"✅ Компанію <code>{edrpou}</code> видалено.",
-                reply_markup=back_to_main_keyboard(),
-                parse_mode="HTML"
-            )
-            logger.info(f"Company removed: {edrpou}")
-        else:
-            await callback.message.edit_text(
-                f"❌ Компанію <code>{edrpou}</code> не знайдено.",
-                reply_markup=back_to_main_keyboard(),
-                parse_mode="HTML"
-            )
+    
+    if success:
+        await callback.message.edit_text(
+            f"✅ Компанію <code>{edrpou}</code> видалено.",
+            reply_markup=back_to_main_keyboard(),
+            parse_mode="HTML"
+        )
+        logger.info(f"Company removed: {edrpou}")
+    else:
+        await callback.message.edit_text(
+            f"❌ Компанію <code>{edrpou}</code> не знайдено.",
+            reply_markup=back_to_main_keyboard(),
+            parse_mode="HTML"
+        )
     await callback.answer()
 
 
@@ -820,7 +835,7 @@ async def callback_pause_company(callback: CallbackQuery):
         return
     edrpou = callback.data.split(":")[2]
     
-    async with AsyncSessionLocal() as session:
+    async with get_uow() as session:
         repo = CompanyRepository(session)
         await repo.deactivate_company(edrpou)
     
@@ -840,7 +855,7 @@ async def callback_resume_company(callback: CallbackQuery):
         return
     edrpou = callback.data.split(":")[2]
     
-    async with AsyncSessionLocal() as session:
+    async with get_uow() as session:
         repo = CompanyRepository(session)
         await repo.activate_company(edrpou)
     
@@ -866,12 +881,34 @@ async def callback_cases_menu(callback: CallbackQuery):
     await callback.answer()
 
 
-@router.callback_query(F.data == "cases:critical")
+# Keyset cursor of a case list page: "<prefix>:<fetched_at>:<id>" of its last row
+_CASES_CURSOR_FMT = "%Y%m%d%H%M%S%f"
+
+
+def _cases_before(data: str) -> Optional[Tuple[datetime, int]]:
+    """(fetched_at, id) cursor from a case list callback, None for the first page"""
+    parts = data.split(":")
+    if len(parts) != 4:
+        return None
+    return datetime.strptime(parts[2], _CASES_CURSOR_FMT), int(parts[3])
+
+
+def _cases_next_page(prefix: str, cases: list, limit: int) -> Optional[str]:
+    """Callback for the page after *cases*, or None if this page is the last"""
+    if len(cases) < limit:
+        return None
+    last = cases[-1]
+    return f"{prefix}:{last.fetched_at.strftime(_CASES_CURSOR_FMT)}:{last.id}"
+
+
+@router.callback_query(F.data.startswith("cases:critical"))
 async def callback_critical_cases(callback: CallbackQuery):
     """Критичні справи"""
-    async with AsyncSessionLocal() as session:
+    async with get_uow() as session:
         repo = CourtCaseRepository(session)
-        cases = await repo.get_cases_by_threat_level("CRITICAL", limit=10)
+        cases = await repo.get_cases_by_threat_level(
+            "CRITICAL", limit=10, before=_cases_before(callback.data)
+        )
         
         if not cases:
             await callback.message.edit_text(
@@ -889,16 +926,20 @@ async def callback_critical_cases(callback: CallbackQuery):
             text += f"  {c.court_name or 'Суд не вказано'}\n"
             text += f"  📅 {c.fetched_at.strftime('%d.%m.%Y')}\n\n"
         
-        await callback.message.edit_text(text, reply_markup=cases_menu_keyboard(), parse_mode="HTML")
+        next_page = _cases_next_page("cases:critical", cases, 10)
+        await callback.message.edit_text(text, reply_markup=cases_menu_keyboard(next_page), parse_mode="HTML")
     await callback.answer()
 
 
-@router.callback_query(F.data == "cases:new")
+@router.callback_query(F.data.startswith("cases:new"))
 async def callback_new_cases(callback: CallbackQuery):
     """Нові справи"""
-    async with AsyncSessionLocal() as session:
+    async with get_uow() as session:
         repo = CourtCaseRepository(session)
-        cases = await repo.get_cases_by_status("new", limit=10)
+        cases = await repo.get_cases_by_status(
+            "new", limit=10, before=_cases_before(callback.data)
+        )
+        next_page = None
         
         if not cases:
             text = "� <b>Нові справи</b>\n\n✅ Нових справ немає!"
@@ -908,17 +949,19 @@ async def callback_new_cases(callback: CallbackQuery):
                 level_emoji = {"CRITICAL": "🚨", "HIGH": "⚠️", "MEDIUM": "📋", "LOW": "ℹ️"}.get(c.threat_level, "📋")
                 text += f"{level_emoji} <code>{c.normalized_case_number}</code>\n"
                 text += f"  {c.court_name or ''}\n\n"
+            next_page = _cases_next_page("cases:new", cases, 10)
         
-        await callback.message.edit_text(text, reply_markup=cases_menu_keyboard(), parse_mode="HTML")
+        await callback.message.edit_text(text, reply_markup=cases_menu_keyboard(next_page), parse_mode="HTML")
     await callback.answer()
 
 
-@router.callback_query(F.data == "cases:all")
+@router.callback_query(F.data.startswith("cases:all"))
 async def callback_all_cases(callback: CallbackQuery):
     """Всі справи"""
-    async with AsyncSessionLocal() as session:
+    async with get_uow() as session:
         repo = CourtCaseRepository(session)
-        cases = await repo.get_recent_cases(limit=15)
+        cases = await repo.get_recent_cases(limit=15, before=_cases_before(callback.data))
+        next_page = None
         
         if not cases:
             text = "📋 <b>Справи</b>\n\nСправ поки немає."
@@ -928,8 +971,9 @@ async def callback_all_cases(callback: CallbackQuery):
                 level_emoji = {"CRITICAL": "🚨", "HIGH": "⚠️", "MEDIUM": "📋", "LOW": "ℹ️"}.get(c.threat_level, "📋")
                 ws_mark = "📁" if c.is_in_worksection else ""
                 text += f"{level_emoji} <code>{c.normalized_case_number}</code> {ws_mark}\n"
+            next_page = _cases_next_page("cases:all", cases, 15)
         
-        await callback.message.edit_text(text, reply_markup=cases_menu_keyboard(), parse_mode="HTML")
+        await callback.message.edit_text(text, reply_markup=cases_menu_keyboard(next_page), parse_mode="HTML")
     await callback.answer()
 
 
@@ -962,7 +1006,7 @@ async def callback_stats_menu(callback: CallbackQuery):
 @router.message(Command("stats"))
 async def callback_general_stats(event: Message | CallbackQuery):
     """Загальна статистика"""
-    async with AsyncSessionLocal() as session:
+    async with get_uow() as session:
         company_repo = CompanyRepository(session)
         notification_repo = NotificationRepository(session)
         ws_repo = WorksectionCaseRepository(session)
@@ -972,7 +1016,7 @@ async def callback_general_stats(event: Message | CallbackQuery):
         active = sum(1 for c in companies if c.is_active)
         
         recent = await notification_repo.get_recent_notifications(100)
-        ws_cases = await ws_repo.get_all_case_numbers()
+        ws_cases_count = await ws_repo.count_case_numbers()
         
         # Count by threat level
         critical = sum(1 for n in recent if n.threat_level == "CRITICAL")
@@ -980,7 +1024,7 @@ async def callback_general_stats(event: Message | CallbackQuery):
         
         text = "� <b>Загальна статистика</b>\n\n"
         text += f"🏢 <b>Компанії:</b> {len(companies)} (активних: {active})\n"
-        text += f"📁 <b>Справ у Worksection:</b> {len(ws_cases)}\n"
+        text += f"📁 <b>Справ у Worksection:</b> {ws_cases_count}\n"
         text += f"📨 <b>Сповіщень:</b> {len(recent)}\n\n"
         
         text += "<b>За рівнем загрози:</b>\n"
@@ -1008,7 +1052,7 @@ async def callback_general_stats(event: Message | CallbackQuery):
 @router.callback_query(F.data == "menu:settings")
 async def callback_settings_menu(callback: CallbackQuery):
     """Меню налаштувань"""
-    async with AsyncSessionLocal() as session:
+    async with get_uow() as session:
         settings_repo = UserSettingsRepository(session)
         receive_all = await settings_repo.get_receive_all(callback.from_user.id)
     
@@ -1031,7 +1075,7 @@ async def callback_toggle_all_notifications(callback: CallbackQuery):
     action = callback.data.split(":")[-1]  # "on" or "off"
     new_value = action == "on"
     
-    async with AsyncSessionLocal() as session:
+    async with get_uow() as session:
         settings_repo = UserSettingsRepository(session)
         await settings_repo.set_receive_all(callback.from_user.id, new_value)
     
@@ -1073,7 +1117,7 @@ async def callback_api_status(callback: CallbackQuery):
     
     # Test Database
     try:
-        async with AsyncSessionLocal() as session:
+        async with get_uow() as session:
             from sqlalchemy import text
             await session.execute(text("SELECT 1"))
         results.append("✅ <b>База даних:</b> OK")
@@ -1261,10 +1305,10 @@ async def cmd_list(message: Message):
     
     # Тільки адмін бачить всі компанії
     if user_id not in settings.admin_ids:
-        async with AsyncSessionLocal() as session:
+        async with get_uow() as session:
             user_sub_repo = UserSubscriptionRepository(session)
             company_repo = CompanyRepository(session)
-            my_subs = await user_sub_repo.get_user_subscriptions(user_id)
+            my_subs = await user_sub_repo.get_user_edrpous(user_id)
             
             if not my_subs:
                 await message.answer(
@@ -1275,15 +1319,16 @@ async def cmd_list(message: Message):
                 return
             
             text = "🔔 <b>Мої підписки:</b>\n\n"
-            for i, sub in enumerate(my_subs, 1):
-                company = await company_repo.get_company(sub.edrpou)
+            companies = await company_repo.get_companies_by_edrpous(my_subs)
+            for i, edrpou in enumerate(my_subs, 1):
+                company = companies.get(edrpou)
                 name = company.company_name if company else "Невідома"
-                text += f"{i}. <code>{sub.edrpou}</code>\n    └ {name}\n"
+                text += f"{i}. <code>{edrpou}</code>\n    └ {name}\n"
             
             await message.answer(text, reply_markup=main_menu_keyboard(), parse_mode="HTML")
         return
     
-    async with AsyncSessionLocal() as session:
+    async with get_uow() as session:
         repo = CompanyRepository(session)
         companies = await repo.get_all_companies()
         
@@ -1308,7 +1353,7 @@ async def cmd_list(message: Message):
 @router.callback_query(F.data == "cases:my_monitored")
 async def callback_my_monitored_cases(callback: CallbackQuery):
     """Список справ на моніторингу"""
-    async with AsyncSessionLocal() as session:
+    async with get_uow() as session:
         case_repo = CaseSubscriptionRepository(session)
         cases = await case_repo.get_user_cases(callback.from_user.id)
     
@@ -1354,7 +1399,7 @@ async def callback_my_cases_page(callback: CallbackQuery):
     """Пагінація списку справ на моніторингу"""
     page = int(callback.data.split(":")[-1])
     
-    async with AsyncSessionLocal() as session:
+    async with get_uow() as session:
         case_repo = CaseSubscriptionRepository(session)
         cases = await case_repo.get_user_cases(callback.from_user.id)
     
@@ -1410,7 +1455,7 @@ async def process_case_number(message: Message, state: FSMContext):
         )
         return
     
-    async with AsyncSessionLocal() as session:
+    async with get_uow() as session:
         case_repo = CaseSubscriptionRepository(session)
         
         # Check if already subscribed
@@ -1440,7 +1485,7 @@ async def process_case_name(message: Message, state: FSMContext):
     case_number = data.get('case_number')
     case_name = message.text.strip() if message.text.strip() != '-' else None
     
-    async with AsyncSessionLocal() as session:
+    async with get_uow() as session:
         case_repo = CaseSubscriptionRepository(session)
         await case_repo.subscribe(message.from_user.id, case_number, case_name)
     
@@ -1463,7 +1508,7 @@ async def callback_unsubscribe_case(callback: CallbackQuery):
     """Підтвердження відписки від справи"""
     case_number = callback.data.split(":", 2)[-1]
     
-    async with AsyncSessionLocal() as session:
+    async with get_uow() as session:
         case_repo = CaseSubscriptionRepository(session)
         cases = await case_repo.get_user_cases(callback.from_user.id)
         case_obj = next((c for c in cases if c.case_number == case_number), None)
@@ -1485,7 +1530,7 @@ async def callback_confirm_case_unsub(callback: CallbackQuery):
     """Підтвердження видалення справи з моніторингу"""
     case_number = callback.data.split(":", 2)[-1]
     
-    async with AsyncSessionLocal() as session:
+    async with get_uow() as session:
         case_repo = CaseSubscriptionRepository(session)
         await case_repo.unsubscribe(callback.from_user.id, case_number)
     
@@ -1547,7 +1592,8 @@ async def callback_contractor_menu(callback: CallbackQuery, state: FSMContext):
     
     # Admins always have access
     if not _is_admin(user_id):
-        async with AsyncSessionLocal() as session:
+        requested = False
+        async with get_uow() as session:
             repo = BotUserRepository(session)
             has_access = await repo.has_contractor_access(user_id)
             
@@ -1555,34 +1601,37 @@ async def callback_contractor_menu(callback: CallbackQuery, state: FSMContext):
                 # Check if already requested
                 bot_user = await repo.get_user(user_id)
                 if bot_user and bot_user.contractor_access_requested:
-                    await callback.message.edit_text(
-                        "⏳ <b>Запит на доступ вже відправлено</b>\n\n"
-                        "Очікуйте підтвердження від адміністратора.",
-                        reply_markup=back_to_main_keyboard(),
-                        parse_mode="HTML"
-                    )
-                    await callback.answer()
-                    return
-                
-                # Register user if not exists
-                if not bot_user:
+                    requested = True
+                elif not bot_user:
+                    # Register user if not exists
                     bot_user = await repo.get_or_create(
                         telegram_user_id=user_id,
                         username=callback.from_user.username,
                         full_name=callback.from_user.full_name
                     )
-                
-                # Ask for FIO before sending request
-                await state.set_state(AccessRequestStates.waiting_for_fio)
-                await callback.message.edit_text(
-                    "🔒 <b>Доступ обмежений</b>\n\n"
-                    "Розділ «Перевірка контрагентів» потребує дозволу адміністратора.\n\n"
-                    "Введіть ваше <b>ПІБ</b> (Прізвище Ім'я По батькові) для запиту доступу:",
-                    reply_markup=back_to_main_keyboard(),
-                    parse_mode="HTML"
-                )
-                await callback.answer()
-                return
+        
+        if requested:
+            await callback.message.edit_text(
+                "⏳ <b>Запит на доступ вже відправлено</b>\n\n"
+                "Очікуйте підтвердження від адміністратора.",
+                reply_markup=back_to_main_keyboard(),
+                parse_mode="HTML"
+            )
+            await callback.answer()
+            return
+        
+        if not has_access:
+            # Ask for FIO before sending request
+            await state.set_state(AccessRequestStates.waiting_for_fio)
+            await callback.message.edit_text(
+                "🔒 <b>Доступ обмежений</b>\n\n"
+                "Розділ «Перевірка контрагентів» потребує дозволу адміністратора.\n\n"
+                "Введіть ваше <b>ПІБ</b> (Прізвище Ім'я По батькові) для запиту доступу:",
+                reply_markup=back_to_main_keyboard(),
+                parse_mode="HTML"
+            )
+            await callback.answer()
+            return
     
     await state.clear()
     await state.set_state(ContractorCheckStates.waiting_for_auto_input)
@@ -1630,7 +1679,7 @@ async def process_access_request_fio(message: Message, state: FSMContext):
     await state.clear()
     
     # Save FIO to bot_user and mark as requested
-    async with AsyncSessionLocal() as session:
+    async with get_uow() as session:
         repo = BotUserRepository(session)
         bot_user = await repo.get_or_create(
             telegram_user_id=user_id,
@@ -1645,7 +1694,6 @@ async def process_access_request_fio(message: Message, state: FSMContext):
             .where(BotUser.telegram_user_id == user_id)
             .values(full_name=fio, contractor_access_requested=True)
         )
-        await session.commit()
     
     await message.answer(
         "✅ <b>Запит на доступ відправлено</b>\n\n"
@@ -1693,7 +1741,7 @@ async def callback_access_grant(callback: CallbackQuery):
     
     target_user_id = int(callback.data.split(":")[2])
     
-    async with AsyncSessionLocal() as session:
+    async with get_uow() as session:
         repo = BotUserRepository(session)
         success = await repo.set_contractor_access(target_user_id, True)
     
@@ -1728,7 +1776,7 @@ async def callback_access_deny(callback: CallbackQuery):
     
     target_user_id = int(callback.data.split(":")[2])
     
-    async with AsyncSessionLocal() as session:
+    async with get_uow() as session:
         repo = BotUserRepository(session)
         # Reset request flag but don't grant access
         from sqlalchemy import update as sql_update
@@ -1738,7 +1786,6 @@ async def callback_access_deny(callback: CallbackQuery):
             .where(BotUser.telegram_user_id == target_user_id)
             .values(contractor_access_requested=False)
         )
-        await session.commit()
     
     await callback.message.edit_text(
         callback.message.text + "\n\n❌ <b>Доступ відхилено</b>",
@@ -1769,7 +1816,7 @@ async def callback_access_revoke(callback: CallbackQuery):
     
     target_user_id = int(callback.data.split(":")[2])
     
-    async with AsyncSessionLocal() as session:
+    async with get_uow() as session:
         repo = BotUserRepository(session)
         await repo.set_contractor_access(target_user_id, False)
     
@@ -1784,7 +1831,7 @@ async def cmd_users(message: Message):
     if not _is_admin(message.from_user.id):
         return
     
-    async with AsyncSessionLocal() as session:
+    async with get_uow() as session:
         repo = BotUserRepository(session)
         users = await repo.get_all_users()
     
@@ -1826,7 +1873,7 @@ async def cmd_users(message: Message):
 
 async def _show_users_list(callback: CallbackQuery):
     """Helper to refresh users list in admin message"""
-    async with AsyncSessionLocal() as session:
+    async with get_uow() as session:
         repo = BotUserRepository(session)
         users = await repo.get_all_users()
     
@@ -3276,16 +3323,14 @@ async def process_user_name(message: Message, state: FSMContext):
     
     # Save user identity to database
     from src.storage.models import UserIdentity
-    from src.storage.database import get_db
     
-    async with get_db() as session:
+    async with get_uow() as session:
         identity = UserIdentity(
             telegram_user_id=user_id,
             full_name=user_name,
             inn=user_inn
         )
         session.add(identity)
-        await session.commit()
     
     await state.clear()
     await message.answer(
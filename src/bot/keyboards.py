@@ -95,10 +95,14 @@ def companies_menu_keyboard(is_admin: bool = False) -> InlineKeyboardMarkup:
     return builder.as_markup()
 
 
-def cases_menu_keyboard() -> InlineKeyboardMarkup:
-    """Меню судових справ"""
+def cases_menu_keyboard(next_page: Optional[str] = None) -> InlineKeyboardMarkup:
+    """Меню судових справ (next_page — callback наступної сторінки списку)"""
     builder = InlineKeyboardBuilder()
     
+    if next_page:
+        builder.row(
+            InlineKeyboardButton(text="▶️ Далі", callback_data=next_page)
+        )
     builder.row(
         InlineKeyboardButton(text="🚨 Критичні справи", callback_data="cases:critical"),
         InlineKeyboardButton(text="⚠️ Нові справи", callback_data="cases:new")
@@ -6,7 +6,7 @@ This replaces direct Worksection API access for security.
 import httpx
 import logging
 from typing import List, Optional
-from datetime import datetime
+from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
 
@@ -35,7 +35,7 @@ class GistClient:
         """
         # Check cache
         if use_cache and self._cache and self._cache_time:
-            age = (datetime.utcnow() - self._cache_time).total_seconds()
+            age = (datetime.now(timezone.utc) - self._cache_time).total_seconds()
             if age < self._cache_ttl:
                 logger.debug(f"Using cached Gist data ({age:.0f}s old)")
                 return self._cache.get('case_numbers', [])
@@ -50,7 +50,7 @@ class GistClient:
                 
                 # Update cache
                 self._cache = data
-                self._cache_time = datetime.utcnow()
+                self._cache_time = datetime.now(timezone.utc)
                 
                 case_numbers = data.get('case_numbers', [])
                 updated_at = data.get('updated_at', 'unknown')
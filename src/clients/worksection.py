@@ -1,6 +1,6 @@
 import hashlib
 import httpx
-from typing import List, Dict, Any, Optional
+from typing import AsyncIterator, List, Dict, Any, Optional
 from src.config import settings
 from tenacity import retry, stop_after_attempt, wait_exponential
 import logging
@@ -84,6 +84,14 @@ class WorksectionClient:
         data = await self._request('get_all_tasks', params)
         return data.get('data', [])
     
+    async def iter_all_tasks(self, extra: str = "text") -> AsyncIterator[Dict]:
+        """Yield tasks project by project instead of loading the whole account"""
+        for project in await self.get_projects():
+            project_ref = {'id': project.get('id'), 'name': project.get('name')}
+            for task in await self.get_tasks(str(project.get('id', '')), extra=extra):
+                task.setdefault('project', project_ref)
+                yield task
+    
     async def get_task(self, task_id: str) -> Optional[Dict]:
         """Get a specific task by ID"""
         params = {'id_task': task_id}
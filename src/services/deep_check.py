@@ -8,13 +8,11 @@ connections graph will have data ready.
 
 import asyncio
 import logging
-import re
 from typing import Set, Dict, Any, Optional
 
-logger = logging.getLogger(__name__)
+from src.utils import validate_edrpou
 
-# Valid EDRPOU: 8 digits
-_EDRPOU_RE = re.compile(r"^\d{8}$")
+logger = logging.getLogger(__name__)
 
 
 def extract_related_codes(
@@ -81,7 +79,7 @@ def extract_related_codes(
 
 def _add(codes: Set[str], value: Any):
     """Add to set if valid EDRPOU."""
-    if value and isinstance(value, str) and _EDRPOU_RE.match(value.strip()):
+    if isinstance(value, str) and validate_edrpou(value):
         codes.add(value.strip())
 
 
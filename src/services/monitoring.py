@@ -2,10 +2,9 @@ from typing import List, Dict, Any
 from datetime import datetime
 from src.clients import OpenDataBotClient
 from src.storage import (
-    AsyncSessionLocal, CompanyRepository, SubscriptionRepository,
+    get_uow, CompanyRepository, SubscriptionRepository,
     WorksectionCaseRepository, NotificationRepository, SyncStateRepository,
-    CourtCaseRepository, UserSubscriptionRepository, UserSettingsRepository,
-    CaseSubscriptionRepository
+    CourtCaseRepository, DispatchRepository
 )
 from src.services.threat_analyzer import analyze_threat
 from src.services.notifier import TelegramNotifier
@@ -33,39 +32,40 @@ class CourtMonitoringService:
         """
         created = 0
         
-        async with AsyncSessionLocal() as session:
-            company_repo = CompanyRepository(session)
+        async with get_uow() as session:
+            companies = await CompanyRepository(session).get_active_companies()
             sub_repo = SubscriptionRepository(session)
             
-            companies = await company_repo.get_active_companies()
-            logger.info(f"Setting up subscriptions for {len(companies)} companies")
-            
+            # Companies without an active company subscription yet
+            missing = []
             for company in companies:
-                edrpou = company.edrpou
-                
-                # Check existing subscriptions
-                existing = await sub_repo.get_subscriptions_by_edrpou(edrpou)
-                existing_types = {s.subscription_type for s in existing}
-                
-                # Create company subscription (monitors all court cases by EDRPOU)
-                # Per OpenDataBot docs: type=company for monitoring legal entities
-                if 'company' not in existing_types:
-                    try:
-                        result = await self.odb_client.create_subscription(
-                            subscription_type='company',
-                            subscription_key=edrpou
+                existing = await sub_repo.get_subscriptions_by_edrpou(company.edrpou)
+                if 'company' not in {s.subscription_type for s in existing}:
+                    missing.append(company.edrpou)
+        logger.info(f"Setting up subscriptions for {len(companies)} companies")
+        
+        # Network calls run outside any transaction
+        for edrpou in missing:
+            # Create company subscription (monitors all court cases by EDRPOU)
+            # Per OpenDataBot docs: type=company for monitoring legal entities
+            try:
+                result = await self.odb_client.create_subscription(
+                    subscription_type='company',
+                    subscription_key=edrpou
+                )
+                sub_id = result.get('data', {}).get('id')
+                if sub_id:
+                    # Commit each subscription as soon as ODB has created it
+                    async with get_uow() as session:
+                        await SubscriptionRepository(session).add_subscription(
+                            subscription_id=str(sub_id),
+                            edrpou=edrpou,
+                            subscription_type='company'
                         )
-                        sub_id = result.get('data', {}).get('id')
-                        if sub_id:
-                            await sub_repo.add_subscription(
-                                subscription_id=str(sub_id),
-                                edrpou=edrpou,
-                                subscription_type='company'
-                            )
-                            created += 1
-                            logger.info(f"Created company subscription for {edrpou}")
-                    except Exception as e:
-                        logger.error(f"Failed to create subscription for {edrpou}: {e}")
+                    created += 1
+                    logger.info(f"Created company subscription for {edrpou}")
+            except Exception as e:
+                logger.error(f"Failed to create subscription for {edrpou}: {e}")
         
         return created
     
@@ -90,173 +90,187 @@ class CourtMonitoringService:
         """
         notifications_sent = 0
         
-        async with AsyncSessionLocal() as session:
-            sync_repo = SyncStateRepository(session)
-            ws_repo = WorksectionCaseRepository(session)
-            notification_repo = NotificationRepository(session)
-            company_repo = CompanyRepository(session)
-            case_repo = CourtCaseRepository(session)
-            
-            # Get last processed notification ID
-            last_id = await sync_repo.get_state('opendatabot_last_notification_id')
-            
+        # 1. Cursor and monitored companies
+        async with get_uow() as session:
+            last_id = await SyncStateRepository(session).get_state('opendatabot_last_notification_id')
             # Get active EDRPOUs (normalize by stripping leading zeros)
-            companies = await company_repo.get_active_companies()
-            edrpou_set = {c.edrpou.lstrip('0') for c in companies}
-            edrpou_names = {c.edrpou.lstrip('0'): c.company_name for c in companies}
-            # Also keep original for lookup
-            edrpou_original = {c.edrpou.lstrip('0'): c.edrpou for c in companies}
+            companies = await CompanyRepository(session).get_active_companies()
+        
+        edrpou_set = {c.edrpou.lstrip('0') for c in companies}
+        edrpou_names = {c.edrpou.lstrip('0'): c.company_name for c in companies}
+        # Also keep original for lookup
+        edrpou_original = {c.edrpou.lstrip('0'): c.edrpou for c in companies}
+        
+        if not edrpou_set:
+            logger.info("No active companies to monitor")
+            return 0
+        
+        logger.info(f"Checking history from_id={last_id}, tracking {len(edrpou_set)} companies")
+        
+        # 2. Fetch history (type=court for court cases) with no session open
+        history = await self.odb_client.get_history(from_id=last_id, limit=100)
+        
+        items = history.get('items', [])
+        logger.info(f"Received {len(items)} history items")
+        
+        max_id = last_id
+        # Court case rows, written in one bulk upsert after the loop
+        court_rows = []
+        
+        page_cases = {
+            normalize_case_number(ci.get('caseNumber', ''))
+            for event in items for ci in event.get('items', [])
+        }
+        page_cases.discard(None)
+        
+        # 3. Subscribers, their filter settings and Worksection dedup for the page
+        async with get_uow() as session:
+            users_by_edrpou, users_by_case, receive_all_users = (
+                await DispatchRepository(session).get_page_subscribers(
+                    list(edrpou_original.values()), list(page_cases)
+                )
+            )
+            # Only look up this page's case numbers
+            new_case_numbers = await WorksectionCaseRepository(session).filter_new_case_numbers(page_cases)
+        
+        # 4. Send notifications; each send runs outside any transaction
+        for event in items:
+            notification_id = str(event.get('notificationId', ''))
+            event_edrpou_raw = str(event.get('code', ''))
+            event_edrpou = event_edrpou_raw.lstrip('0')  # Normalize EDRPOU
+            event_type = event.get('type', '')
             
-            if not edrpou_set:
-                logger.info("No active companies to monitor")
-                return 0
+            # Skip if not court-related event
+            if not event_type or 'court' not in event_type:
+                continue
             
-            # Get Worksection case numbers for deduplication
-            ws_case_numbers = set(await ws_repo.get_all_case_numbers())
+            # Skip if not our company
+            if event_edrpou not in edrpou_set:
+                logger.debug(f"Event for {event_edrpou_raw} (normalized: {event_edrpou}) - not in monitoring list, skipping")
+                continue
             
-            logger.info(f"Checking history from_id={last_id}, tracking {len(edrpou_set)} companies")
+            # Track max ID (compare as integers to avoid string comparison bugs)
+            try:
+                nid_int = int(notification_id) if notification_id else 0
+                max_int = int(max_id) if max_id else 0
+                last_int = int(last_id) if last_id else 0
+            except (ValueError, TypeError):
+                nid_int = 0
+                max_int = 0
+                last_int = 0
             
-            # Fetch history (type=court for court cases)
-            history = await self.odb_client.get_history(from_id=last_id, limit=100)
+            if nid_int > max_int:
+                max_id = notification_id
             
-            items = history.get('items', [])
-            logger.info(f"Received {len(items)} history items")
+            # Skip if already processed
+            if last_int and nid_int <= last_int:
+                continue
             
-            max_id = last_id
+            # Process court items from this event
+            court_items = event.get('items', [])
+            logger.info(f"Processing event {notification_id} for {event_edrpou}: {len(court_items)} court items")
             
-            for event in items:
-                notification_id = str(event.get('notificationId', ''))
-                event_edrpou_raw = str(event.get('code', ''))
-                event_edrpou = event_edrpou_raw.lstrip('0')  # Normalize EDRPOU
-                event_type = event.get('type', '')
+            for ci in court_items:
+                case_number = ci.get('caseNumber', '')
+                normalized = normalize_case_number(case_number)
                 
-                # Skip if not court-related event
-                if not event_type or 'court' not in event_type:
+                if not normalized:
                     continue
                 
-                # Skip if not our company
-                if event_edrpou not in edrpou_set:
-                    logger.debug(f"Event for {event_edrpou_raw} (normalized: {event_edrpou}) - not in monitoring list, skipping")
-                    continue
+                # Check if in Worksection (already known)
+                is_in_worksection = normalized not in new_case_numbers
                 
-                # Track max ID (compare as integers to avoid string comparison bugs)
-                try:
-                    nid_int = int(notification_id) if notification_id else 0
-                    max_int = int(max_id) if max_id else 0
-                    last_int = int(last_id) if last_id else 0
-                except (ValueError, TypeError):
-                    nid_int = 0
-                    max_int = 0
-                    last_int = 0
+                # Get original EDRPOU for DB lookups
+                original_edrpou = edrpou_original.get(event_edrpou, event_edrpou)
                 
-                if nid_int > max_int:
-                    max_id = notification_id
+                # Build case data
+                case_data = {
+                    'case_id': ci.get('number'),
+                    'normalized_case_number': normalized,
+                    'court_name': ci.get('courtName', ''),
+                    'case_type_name': ci.get('form', ''),
+                    'document_type': ci.get('type', ''),
+                    'date_opened': ci.get('date'),
+                    'source_link': ci.get('documentLink', ''),
+                    'edrpou_matches': [original_edrpou],
+                    'company_name': edrpou_names.get(event_edrpou, ''),
+                }
                 
-                # Skip if already processed
-                if last_int and nid_int <= last_int:
-                    continue
+                # Determine threat level
+                is_criminal = 'Кримінальне' in ci.get('form', '')
+                threat_analysis = analyze_threat(case_data, original_edrpou)
+                if is_criminal:
+                    threat_analysis['threat_level'] = 'CRITICAL'
+                    threat_analysis['emoji'] = '🚨'
+                
+                # Queue for local DB
+                court_rows.append({
+                    'case_id': ci.get('number'),
+                    'normalized_case_number': normalized,
+                    'court_name': ci.get('courtName'),
+                    'case_type_name': ci.get('form'),
+                    'source_link': ci.get('documentLink'),
+                    'edrpou_matches': [original_edrpou],
+                    'status': 'new',
+                    'threat_level': threat_analysis.get('threat_level', 'MEDIUM'),
+                    'is_in_worksection': is_in_worksection,
+                })
                 
-                # Process court items from this event
-                court_items = event.get('items', [])
-                logger.info(f"Processing event {notification_id} for {event_edrpou}: {len(court_items)} court items")
+                # Subscribed users (prefetched for the page)
+                subscribed_users = users_by_edrpou.get(original_edrpou, [])
                 
-                for ci in court_items:
-                    case_number = ci.get('caseNumber', '')
-                    normalized = normalize_case_number(case_number)
-                    
-                    if not normalized:
-                        continue
-                    
-                    # Check if in Worksection (already known)
-                    is_in_worksection = normalized in ws_case_numbers
-                    
-                    # Get original EDRPOU for DB lookups
-                    original_edrpou = edrpou_original.get(event_edrpou, event_edrpou)
-                    
-                    # Build case data
-                    case_data = {
-                        'case_id': ci.get('number'),
-                        'normalized_case_number': normalized,
-                        'court_name': ci.get('courtName', ''),
-                        'case_type_name': ci.get('form', ''),
-                        'document_type': ci.get('type', ''),
-                        'date_opened': ci.get('date'),
-                        'source_link': ci.get('documentLink', ''),
-                        'edrpou_matches': [original_edrpou],
-                        'company_name': edrpou_names.get(event_edrpou, ''),
-                    }
-                    
-                    # Determine threat level
-                    is_criminal = 'Кримінальне' in ci.get('form', '')
-                    threat_analysis = analyze_threat(case_data, 'defendant')
-                    if is_criminal:
-                        threat_analysis['threat_level'] = 'CRITICAL'
-                        threat_analysis['emoji'] = '🚨'
-                    
-                    # Save to local DB
-                    await case_repo.upsert_case({
-                        'case_id': ci.get('number'),
-                        'normalized_case_number': normalized,
-                        'court_name': ci.get('courtName'),
-                        'case_type_name': ci.get('form'),
-                        'source_link': ci.get('documentLink'),
-                        'edrpou_matches': [original_edrpou],
-                        'status': 'new',
-                        'threat_level': threat_analysis.get('threat_level', 'MEDIUM'),
-                        'is_in_worksection': is_in_worksection,
-                    })
-                    
-                    # Get subscribed users and their settings
-                    user_sub_repo = UserSubscriptionRepository(session)
-                    settings_repo = UserSettingsRepository(session)
-                    case_sub_repo = CaseSubscriptionRepository(session)
-                    
-                    subscribed_users = await user_sub_repo.get_users_for_edrpou(original_edrpou)
-                    
-                    # Also get users subscribed to this specific case number
-                    case_subscribed_users = await case_sub_repo.get_users_for_case(normalized)
-                    
-                    # Combine and deduplicate users
-                    all_users = set(subscribed_users) | set(case_subscribed_users)
-                    
-                    if all_users:
-                        for user_id in all_users:
-                            # Check user settings
-                            receive_all = await settings_repo.get_receive_all(user_id)
-                            is_case_sub = user_id in case_subscribed_users
-                            
-                            # Skip if in Worksection AND user doesn't want all notifications AND not case subscription
-                            if is_in_worksection and not receive_all and not is_case_sub:
-                                logger.debug(f"Skipping {normalized} for user {user_id} - in WS, filter enabled")
-                                continue
-                            
-                            msg_id = await self.notifier.send_case_notification(
-                                case_data=case_data,
-                                threat_analysis=threat_analysis,
-                                edrpou_matches=[original_edrpou],
-                                chat_id=str(user_id),
-                                is_new_case=not is_in_worksection,
-                                is_case_subscription=is_case_sub
-                            )
-                            if msg_id:
-                                notifications_sent += 1
-                        logger.info(f"Processed case {normalized} for {len(all_users)} users (in_ws={is_in_worksection})")
-                    else:
-                        # Fallback to admin if no user subscriptions (only if not in Worksection)
-                        if not is_in_worksection:
-                            msg_id = await self.notifier.send_case_notification(
-                                case_data=case_data,
-                                threat_analysis=threat_analysis,
-                                edrpou_matches=[original_edrpou],
-                                is_new_case=True
-                            )
-                            if msg_id:
-                                notifications_sent += 1
-                                logger.info(f"Sent admin notification for case {normalized}")
+                # Also users subscribed to this specific case number
+                case_subscribed_users = users_by_case.get(normalized, [])
+                
+                # Combine and deduplicate users
+                all_users = set(subscribed_users) | set(case_subscribed_users)
+                
+                if all_users:
+                    for user_id in all_users:
+                        # Check user settings (prefetched for the page)
+                        receive_all = user_id in receive_all_users
+                        is_case_sub = user_id in case_subscribed_users
+                        
+                        # Skip if in Worksection AND user doesn't want all notifications AND not case subscription
+                        if is_in_worksection and not receive_all and not is_case_sub:
+                            logger.debug(f"Skipping {normalized} for user {user_id} - in WS, filter enabled")
+                            continue
+                        
+                        msg_id = await self.notifier.send_case_notification(
+                            case_data=case_data,
+                            threat_analysis=threat_analysis,
+                            edrpou_matches=[original_edrpou],
+                            chat_id=str(user_id),
+                            is_new_case=not is_in_worksection,
+                            is_case_subscription=is_case_sub
+                        )
+                        if msg_id:
+                            notifications_sent += 1
+                    logger.info(f"Processed case {normalized} for {len(all_users)} users (in_ws={is_in_worksection})")
+                else:
+                    # Fallback to admin if no user subscriptions (only if not in Worksection)
+                    if not is_in_worksection:
+                        msg_id = await self.notifier.send_case_notification(
+                            case_data=case_data,
+                            threat_analysis=threat_analysis,
+                            edrpou_matches=[original_edrpou],
+                            is_new_case=True
+                        )
+                        if msg_id:
+                            notifications_sent += 1
+                            logger.info(f"Sent admin notification for case {normalized}")
+        
+        # 5. Store the page's cases and advance the cursor in one transaction
+        async with get_uow() as session:
+            await CourtCaseRepository(session).bulk_upsert_cases(court_rows)
             
             # Update last processed ID
             if max_id and max_id != last_id:
-                await sync_repo.set_state('opendatabot_last_notification_id', max_id)
+                await SyncStateRepository(session).set_state('opendatabot_last_notification_id', max_id)
+        
+        # Record sent notifications once the page is committed, so the batch
+        # never waits on the write lock held by the transaction above
+        await self.notifier.batcher.flush()
         
         logger.info(f"Check completed: {notifications_sent} notifications sent")
         return notifications_sent
@@ -326,3 +340,6 @@ async def run_monitoring_cycle(bot: Bot = None):
     except Exception as e:
         logger.error(f"Monitoring cycle error: {e}")
         raise
+    finally:
+        # Also runs when shutdown cancels the job, so queued records are kept
+        await service.notifier.close()
@@ -1,9 +1,10 @@
 from typing import Dict, Any, Optional, List
 from aiogram import Bot
 from src.config import settings
-from src.storage import AsyncSessionLocal, NotificationRepository
+from src.storage import get_uow, NotificationRepository
 from src.services.threat_analyzer import get_threat_emoji, get_role_description
 from src.utils import generate_case_key
+import asyncio
 import hashlib
 import json
 import logging
@@ -11,12 +12,108 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+class NotificationBatcher:
+    """Coalesce notification log writes into batched INSERTs.
+    
+    Rows are queued without blocking the sender; a background task writes up
+    to ``max_batch`` rows at once, waiting at most ``max_delay`` seconds for a
+    batch to fill. Keys stay in ``pending`` until committed so deduplication
+    keeps working before the row reaches the database. A failed batch is
+    queued again up to ``max_retries`` times; rows that still fail keep their
+    key in ``pending``, since the message itself has already been sent.
+    """
+    
+    def __init__(self, max_batch: int = 500, max_delay: float = 0.2, max_retries: int = 3):
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.max_retries = max_retries
+        self.pending: Dict[str, asyncio.Future] = {}
+        self._attempts: Dict[str, int] = {}
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+    
+    def enqueue(self, row: Dict[str, Any]) -> asyncio.Future:
+        """Queue a NotificationSent row; the future resolves to True once committed."""
+        if self._task is None or self._task.done():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._run())
+        future = asyncio.get_running_loop().create_future()
+        self.pending[row['case_key']] = future
+        self._queue.put_nowait(row)
+        return future
+    
+    async def flush(self):
+        """Wait until every queued row has been written."""
+        if self._queue is not None and self._task is not None and not self._task.done():
+            await self._queue.join()
+    
+    async def close(self):
+        """Write out every queued row, then stop the background task."""
+        await self.flush()
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+    
+    async def _run(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            deadline = loop.time() + self.max_delay
+            while len(batch) < self.max_batch:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+                except asyncio.TimeoutError:
+                    break
+            await self._write(batch)
+    
+    async def _write(self, batch: List[Dict[str, Any]]):
+        try:
+            async with get_uow() as session:
+                await NotificationRepository(session).add_notifications(batch)
+        except Exception as e:
+            logger.error(f"Failed to record {len(batch)} notifications: {e}")
+            await asyncio.sleep(self.max_delay)
+            for row in batch:
+                key = row['case_key']
+                attempts = self._attempts.get(key, 0) + 1
+                if attempts <= self.max_retries:
+                    self._attempts[key] = attempts
+                    self._queue.put_nowait(row)
+                else:
+                    # Give up but keep the key pending: the message went out
+                    self._attempts.pop(key, None)
+                    logger.error(f"Dropped notification record for {key} after {attempts} attempts")
+                    future = self.pending.get(key)
+                    if future is not None and not future.done():
+                        future.set_result(False)
+                self._queue.task_done()
+            return
+        for row in batch:
+            self._attempts.pop(row['case_key'], None)
+            future = self.pending.pop(row['case_key'], None)
+            if future is not None and not future.done():
+                future.set_result(True)
+            self._queue.task_done()
+
+
 class TelegramNotifier:
     """Send court case notifications to Telegram"""
     
     def __init__(self, bot: Bot = None):
         self.bot = bot or Bot(token=settings.TELEGRAM_BOT_TOKEN)
         self.chat_id = None  # Will be set from admin IDs or specific chat
+        self.batcher = NotificationBatcher()
+    
+    async def close(self):
+        """Record every queued notification and stop the log writer."""
+        await self.batcher.close()
     
     async def send_case_notification(
         self,
@@ -48,47 +145,46 @@ class TelegramNotifier:
         case_key = f"{base_case_key}:{target_chat}"  # Per-user deduplication
         
         # Check if already notified to this user
-        async with AsyncSessionLocal() as session:
+        async with get_uow() as session:
             repo = NotificationRepository(session)
-            
-            if await repo.notification_sent(case_key):
+            if case_key in self.batcher.pending or await repo.notification_sent(case_key):
                 logger.debug(f"Notification already sent for {case_key}")
                 return None
-            
-            # Format message
-            message = self._format_case_message(
-                case_data, threat_analysis, edrpou_matches, 
-                is_new_case, is_case_subscription
+        
+        # Format message
+        message = self._format_case_message(
+            case_data, threat_analysis, edrpou_matches, 
+            is_new_case, is_case_subscription
+        )
+        
+        # Send message
+        try:
+            sent = await self.bot.send_message(
+                chat_id=target_chat,
+                text=message,
+                parse_mode="HTML",
+                disable_web_page_preview=True
             )
             
-            # Send message
-            try:
-                sent = await self.bot.send_message(
-                    chat_id=target_chat,
-                    text=message,
-                    parse_mode="HTML",
-                    disable_web_page_preview=True
-                )
-                
-                # Record notification
-                payload_hash = hashlib.md5(json.dumps(case_data, sort_keys=True, default=str).encode()).hexdigest()
-                
-                await repo.add_notification(
-                    case_key=case_key,
-                    normalized_case_number=case_data.get('normalized_case_number'),
-                    threat_level=threat_analysis.get('threat_level'),
-                    telegram_message_id=str(sent.message_id),
-                    telegram_chat_id=target_chat,
-                    payload_hash=payload_hash
-                )
-                
-                logger.info(f"Notification sent for case {case_key}")
-                return str(sent.message_id)
-                
-            except Exception as e:
-                logger.error(f"Failed to send notification: {e}")
-                return None
-    
+            # Record notification
+            payload_hash = hashlib.md5(json.dumps(case_data, sort_keys=True, default=str).encode()).hexdigest()
+            
+            self.batcher.enqueue({
+                'case_key': case_key,
+                'normalized_case_number': case_data.get('normalized_case_number'),
+                'threat_level': threat_analysis.get('threat_level'),
+                'telegram_message_id': str(sent.message_id),
+                'telegram_chat_id': target_chat,
+                'payload_hash': payload_hash,
+            })
+            
+            logger.info(f"Notification sent for case {case_key}")
+            return str(sent.message_id)
+            
+        except Exception as e:
+            logger.error(f"Failed to send notification: {e}")
+            return None
+
     def _format_case_message(
         self,
         case_data: Dict[str, Any],
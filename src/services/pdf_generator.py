@@ -13,11 +13,20 @@ Installation:
 from __future__ import annotations
 
 import asyncio
+import functools
+import io
 import re as _re
+import sys
 from datetime import datetime
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
+from typing import Callable, Iterator
 
 from fpdf import FPDF
+from fpdf.enums import Align
+from fpdf.fonts import FontFace
+from fpdf.line_break import TextLine
 
 
 # ── Color palette (black + gold + white/gray) ────────────────────────────────
@@ -40,10 +49,21 @@ _CARD_GRAY_BG = (242, 242, 240)
 _CARD_ORANGE_BG = (255, 243, 224)
 _CARD_RED_BG = (255, 232, 230)
 
+# ── Glyphs ────────────────────────────────────────────────────────────────────
+
+_DASH = "\u2014"
+_CHECK = "\u2713"
+_CROSS = "\u2717"
+_TRIANGLE = "\u25b8"
+_ELLIPSIS = "\u2026"
+_SHY = "\u00ad"
+
 # ── Assets ────────────────────────────────────────────────────────────────────
 
 _ASSETS_DIR = Path(__file__).parent / "assets"
 _LOGO_PATH = _ASSETS_DIR / "logo.jpg"
+# Read once at import; each report gets its own in-memory stream
+_LOGO_BYTES = _LOGO_PATH.read_bytes() if _LOGO_PATH.is_file() else None
 
 # ── Rendering configuration ───────────────────────────────────────────────────
 #
@@ -206,11 +226,18 @@ _FIELD_GROUPS: list[tuple[str, list[str]]] = [
     ]),
 ]
 
+# Reverse index: scalar key → (group index, position within group)
+_KEY_TO_GROUP: dict[str, tuple[int, int]] = {
+    k: (gi, ki)
+    for gi, (_, keys) in enumerate(_FIELD_GROUPS)
+    for ki, k in enumerate(keys)
+}
+
 # Fields that receive status coloring (green / red)
-_STATUS_FIELDS = frozenset({"status", "correctINN", "stolen", "invalid"})
+_STATUS_FIELDS = frozenset(map(sys.intern, {"status", "correctINN", "stolen", "invalid"}))
 
 # Fields to hide from output
-_SKIP_FIELDS = frozenset({
+_SKIP_FIELDS = frozenset(map(sys.intern, {
     "address", "statusService", "formattedPhones", "state",
     "lastDate", "lastTime", "objectName", "innHash", "country",
     "registration", "authorisedCapital", "link",
@@ -229,7 +256,7 @@ _SKIP_FIELDS = frozenset({
     "treasure_stats", "tenderer_stats", "buyer_stats",
     "available_finances", "tax_debt", "vat", "single_tax",
     "non_profit", "owned", "edr",
-})
+}))
 
 # Positive-status keywords (lowercase)
 _POS = frozenset({"active", "зареєстровано", "так"})
@@ -378,6 +405,14 @@ def _font_dir() -> Path:
     )
 
 
+# Glyph width cache: (family, style, size_pt) → {char: width in mm}.
+# Shared across reports — the fonts never change at runtime.
+_GLYPH_W: dict[tuple[str, str, float], dict[str, float]] = {}
+
+# Small gray print for notes under a section header
+_NOTE_FACE = FontFace(family="DV", emphasis="", size_pt=7.5, color=_GRAY)
+
+
 # ── PDF class ─────────────────────────────────────────────────────────────────
 
 class _ReportPDF(FPDF):
@@ -441,9 +476,9 @@ class _ReportPDF(FPDF):
         logo_size = 28
         logo_x = self.l_margin + 3
         logo_y = (banner_h - logo_size) / 2
-        if _LOGO_PATH.is_file():
+        if _LOGO_BYTES:
             self.image(
-                str(_LOGO_PATH), logo_x, logo_y,
+                io.BytesIO(_LOGO_BYTES), logo_x, logo_y,
                 logo_size, logo_size,
             )
 
@@ -526,6 +561,7 @@ class _ReportPDF(FPDF):
     ) -> None:
         n = len(hdrs)
         ws = widths or [self.pw / n] * n
+        xs = [self.l_margin + sum(ws[:i]) for i in range(n)]
         lh = 5.0
         pad = 1.5
 
@@ -557,17 +593,23 @@ class _ReportPDF(FPDF):
                 self.set_fill_color(*_WHITE)
             self.rect(self.l_margin, y0, self.pw, rh, "F")
 
-            # cell text
+            # cell text — font/color set once per row; only the status
+            # column switches color and restores it afterwards
+            if hdr:
+                self.set_font("DV", "B", 8)
+                self.set_text_color(*_WHITE)
+            else:
+                self.set_font("DV", "", 8)
+                self.set_text_color(*_TEXT)
+            status_col = None if hdr else scol
             for i, t in enumerate(cells):
-                x = self.l_margin + sum(ws[:i])
-                self.set_xy(x, y0 + pad)
-                if hdr:
-                    self.set_font("DV", "B", 8)
-                    self.set_text_color(*_WHITE)
-                else:
-                    self.set_font("DV", "", 8)
+                self.set_xy(xs[i], y0 + pad)
+                if i == status_col:
                     self._status_color(t, i, scol)
-                self.multi_cell(ws[i], lh, f" {t}", align="L")
+                    self.multi_cell(ws[i], lh, f" {t}", align="L")
+                    self.set_text_color(*_TEXT)
+                else:
+                    self.multi_cell(ws[i], lh, f" {t}", align="L")
 
             self.set_y(y0 + rh)
 
@@ -581,15 +623,15 @@ class _ReportPDF(FPDF):
         if scol is not None and col == scol:
             lo = txt.lower()
             # Explicit positive markers
-            if any(k in lo for k in ("\u2713", "чисто", "активн", "так")):
+            if any(k in lo for k in (_CHECK, "чисто", "активн", "так")):
                 self.set_text_color(*_GREEN)
                 return
             # Explicit negative markers (only with ✗ prefix)
-            if any(k in lo for k in ("\u2717", "недійсн", "викрад")):
+            if any(k in lo for k in (_CROSS, "недійсн", "викрад")):
                 self.set_text_color(*_RED)
                 return
             # Informational "Знайдено" without ✗ → blue (neutral)
-            if "знайдено" in lo and "\u2717" not in txt:
+            if "знайдено" in lo and _CROSS not in txt:
                 self.set_text_color(*_BLUE)
                 return
             # FOP status "зареєстровано" without ✓ prefix → blue
@@ -600,12 +642,140 @@ class _ReportPDF(FPDF):
 
     # ── factor risk card ─────────────────────────────────────────────────
 
+    def _text_w(self, text: str) -> float:
+        """String width for the current font via the cached glyph table."""
+        key = (self.font_family, self.font_style, self.font_size_pt)
+        lut = _GLYPH_W.get(key)
+        if lut is None:
+            lut = _GLYPH_W[key] = {}
+        w = 0.0
+        for ch in text:
+            cw = lut.get(ch)
+            if cw is None:
+                cw = lut[ch] = self.get_string_width(ch)
+            w += cw
+        return w
+
+    def _wrap(self, text: str, width: float) -> Iterator[tuple[str, bool]]:
+        """Word-wrap *text* into lines that fit *width* (current font).
+
+        Breaks at spaces and ``\\n``, and like multi_cell at soft hyphens,
+        which render as "-" when a line ends there and vanish otherwise;
+        words wider than a line are split.
+        Yields ``(line, justify)``: like multi_cell, only lines broken at a
+        space or soft hyphen are justified, not split words or the end of a
+        paragraph. Pure measurement — nothing is written to the page.
+        """
+        avail = width - 2 * self.c_margin
+        space_w = self._text_w(" ")
+        hyphen_w = self._text_w("-")
+        if text.endswith("\n"):
+            # multi_cell does not open an empty line for a trailing newline
+            text = text[:-1]
+        paras = text.split("\n")
+        for n, para in enumerate(paras, 1):
+            line, line_w = "", 0.0
+            for i, word in enumerate(para.split(" ")):
+                ww, fit_w = self._word_w(word)
+                if i and line_w + space_w + fit_w <= avail:
+                    line += " " + word.replace(_SHY, "")
+                    line_w += space_w + ww
+                    continue
+                if i:
+                    # multi_cell prefers a soft hyphen in the overflowing
+                    # word to the space before it
+                    split = self._shy_split(word, avail - line_w - space_w)
+                    if split:
+                        head, word = split
+                        yield f"{line} {head}", True
+                        ww, fit_w = self._word_w(word)
+                    else:
+                        yield line, True
+                while fit_w > avail and len(word) > 1:
+                    split = self._shy_split(word, avail)
+                    if split:
+                        head, word = split
+                        yield head, True
+                    else:
+                        # Forced break: a soft hyphen is measured as "-"
+                        cut, acc = 0, 0.0
+                        for ch in word:
+                            cw = self._text_w(ch) if ch != _SHY else hyphen_w
+                            if acc + cw > avail:
+                                break
+                            if ch != _SHY:
+                                acc += cw
+                            cut += 1
+                        cut = max(cut, 1)
+                        yield word[:cut].replace(_SHY, ""), False
+                        word = word[cut:]
+                    ww, fit_w = self._word_w(word)
+                line, line_w = word.replace(_SHY, ""), ww
+            if line or n < len(paras) or _SHY not in para:
+                # multi_cell drops a final line left with only soft hyphens
+                yield line, False
+
+    def _word_w(self, word: str) -> tuple[float, float]:
+        """Width of *word* as drawn, and the width multi_cell needs to keep
+        it on one line: every soft hyphen must fit once drawn as "-"."""
+        if _SHY not in word:
+            w = self._text_w(word)
+            return w, w
+        head, _, tail = word.rpartition(_SHY)
+        head_w = self._text_w(head.replace(_SHY, ""))
+        w = head_w + self._text_w(tail)
+        return w, max(w, head_w + self._text_w("-"))
+
+    def _shy_split(self, word: str, room: float) -> tuple[str, str] | None:
+        """Split *word* at its last soft hyphen whose head fits *room*.
+
+        Returns ``(head + "-", tail)`` or ``None`` when no soft hyphen fits.
+        """
+        if _SHY not in word:
+            return None
+        parts = word.split(_SHY)
+        hyphen_w = self._text_w("-")
+        best, head_w = 0, 0.0
+        for k, part in enumerate(parts[:-1], 1):
+            head_w += self._text_w(part)
+            if head_w + hyphen_w > room:
+                break
+            best = k
+        if not best:
+            return None
+        return "".join(parts[:best]) + "-", _SHY.join(parts[best:])
+
+    def _line_cell(self, w: float, h: float, text: str, justify: bool) -> None:
+        """One pre-wrapped line, justified the way multi_cell would draw it.
+
+        cell() refuses align="J", so a justified line goes through the same
+        TextLine rendering multi_cell uses for its own lines.
+        """
+        if not justify or " " not in text:
+            self.cell(w, h, text)
+            return
+        frags = self._preload_font_styles(self.normalize_text(text), False)
+        self._render_styled_text_line(
+            TextLine(
+                frags,
+                text_width=sum(f.get_width() for f in frags),
+                number_of_spaces=text.count(" "),
+                align=Align.J,
+                height=h,
+                max_width=w,
+            ),
+            h,
+        )
+
+    def _count_lines(self, text: str, width: float) -> int:
+        """Number of wrapped lines *text* occupies at *width*."""
+        return sum(1 for _ in self._wrap(text, width))
+
     def _measure_text_h(self, text: str, width: float, lh: float) -> float:
-        """Calculate height of text rendered via multi_cell using dry_run."""
+        """Calculate height of text rendered via multi_cell."""
         if not text:
             return lh
-        result = self.multi_cell(width, lh, text, dry_run=True, output="LINES")
-        return max(1, len(result)) * lh
+        return self._count_lines(text, width) * lh
 
     def factor_card(
         self,
@@ -630,9 +800,7 @@ class _ReportPDF(FPDF):
         title_h = self._measure_text_h(title, content_w, lh)
 
         self.set_font("DV", "", 8)
-        body_h = 0.0
-        for ln in lines:
-            body_h += self._measure_text_h(ln, content_w, lh)
+        body_h = sum(self._count_lines(ln, content_w) for ln in lines) * lh
 
         card_h = pad_y + title_h + 1.5 + body_h + pad_y
         page_avail = self.h - 22
@@ -730,16 +898,15 @@ class _ReportPDF(FPDF):
         cy = y0 + title_block_h
 
         # --- Date blocks with alternating backgrounds ---
-        self.set_font("DV", "", 8)
         for idx, block_lines in enumerate(blocks):
             bg = bg_even if idx % 2 == 0 else bg_odd
 
-            # Measure block height
+            # Wrap once: the same sub-lines are used for height and output
             self.set_font("DV", "B", 8)
-            date_h = self._measure_text_h(block_lines[0], content_w, lh) if block_lines else 0
+            date_lines = list(self._wrap(block_lines[0], content_w)) if block_lines else []
             self.set_font("DV", "", 8)
-            body_h = sum(self._measure_text_h(ln, content_w, lh) for ln in block_lines[1:])
-            block_h = pad_y * 0.5 + date_h + body_h + pad_y * 0.5
+            body_lines = [sub for ln in block_lines[1:] for sub in self._wrap(ln, content_w)]
+            block_h = pad_y * 0.5 + (len(date_lines) + len(body_lines)) * lh + pad_y * 0.5
 
             # Page break if needed
             if cy + block_h + 3 > page_avail:
@@ -756,29 +923,36 @@ class _ReportPDF(FPDF):
             by = cy + pad_y * 0.5
 
             # Date header (bold)
-            if block_lines:
-                self.set_font("DV", "B", 8)
-                self.set_text_color(*_BLACK)
+            self.set_font("DV", "B", 8)
+            self.set_text_color(*_BLACK)
+            for sub, justify in date_lines:
                 self.set_xy(tx, by)
-                self.multi_cell(content_w, lh, block_lines[0], new_x="LMARGIN", new_y="NEXT")
-                by = self.get_y()
+                self._line_cell(content_w, lh, sub, justify)
+                by += lh
 
             # Change details
             self.set_font("DV", "", 8)
             self.set_text_color(*_DARK)
-            for ln in block_lines[1:]:
+            for sub, justify in body_lines:
                 if by + lh > page_avail:
                     self.add_page()
                     by = self.get_y()
                 self.set_xy(tx, by)
-                self.multi_cell(content_w, lh, ln, new_x="LMARGIN", new_y="NEXT")
-                by = self.get_y()
+                self._line_cell(content_w, lh, sub, justify)
+                by += lh
 
             cy = by + pad_y * 0.5
 
         self.set_y(cy + 2.5)
         self.set_text_color(*_TEXT)
 
+    # ── small gray note ───────────────────────────────────────────────────
+
+    def note(self, text: str) -> None:
+        with self.use_font_face(_NOTE_FACE):
+            self.multi_cell(self.pw, 4, text, new_x="LMARGIN", new_y="NEXT")
+        self.ln(3)
+
     # ── thin separator line ───────────────────────────────────────────────
 
     def separator(self) -> None:
@@ -792,6 +966,23 @@ class _ReportPDF(FPDF):
 # ── Value helpers ─────────────────────────────────────────────────────────────
 
 
+# Thousands separator → non-breaking space (keeps digit groups on one line)
+_COMMA_TO_SPACE = str.maketrans(",", "\u00a0")
+
+_DATE_FMT = "%d.%m.%Y"
+_DATETIME_FMT = "%d.%m.%Y %H:%M"
+
+# Value types that are safe (hashable) to memoize formatting for
+_CACHEABLE = (str, int, float, bool, type(None))
+
+
+@functools.lru_cache(maxsize=1024)
+def _fmt_ts(ts: int, fmt: str = _DATE_FMT) -> str:
+    """Format a Unix timestamp as a local date (same stamps repeat a lot)."""
+    return datetime.fromtimestamp(ts).strftime(fmt)
+
+
+@functools.lru_cache(maxsize=2048)
 def _humanize(key: str) -> str:
     """Convert camelCase / snake_case key to a readable label."""
     s = _re.sub(r"([a-z])([A-Z])", r"\1 \2", key)
@@ -799,30 +990,40 @@ def _humanize(key: str) -> str:
 
 
 def _fmt(key: str, value: object) -> str:
-    """Format a single value for display."""
+    """Format a single value for display (memoized for scalar values)."""
+    if isinstance(value, _CACHEABLE):
+        return _fmt_cached(key, value)
+    return _fmt_value(key, value)
+
+
+def _fmt_value(key: str, value: object) -> str:
+    """Uncached body of :func:`_fmt`."""
     if value is None or value == "":
-        return "\u2014"
+        return _DASH
     if isinstance(value, bool):
         return "Так" if value else "Ні"
     if isinstance(value, list):
-        return ", ".join(str(v) for v in value) if value else "\u2014"
+        return ", ".join(str(v) for v in value) if value else _DASH
     if key == "sex":
         return _SEX_UA.get(str(value), str(value))
     if key == "rate":
         return f"{value}%"
     if key == "capital":
         try:
-            return f"{int(value):,} грн".replace(",", " ")
+            return format(int(value), ",d").translate(_COMMA_TO_SPACE) + " грн"
         except (ValueError, TypeError):
             pass
     # Unix timestamps → human date
     if key in ("updated", "Updated") and isinstance(value, (int, float)) and value > 1_000_000_000:
         try:
-            from datetime import datetime as _dt
-            return _dt.fromtimestamp(int(value)).strftime("%d.%m.%Y %H:%M")
+            return _fmt_ts(int(value), _DATETIME_FMT)
         except (ValueError, TypeError, OSError):
             pass
-    return str(value) if str(value) else "\u2014"
+    return str(value) if str(value) else _DASH
+
+
+# typed=True keeps True / 1 / 1.0 apart — they format differently
+_fmt_cached = functools.lru_cache(maxsize=4096, typed=True)(_fmt_value)
 
 
 def _color(key: str, value: object) -> str | None:
@@ -831,10 +1032,15 @@ def _color(key: str, value: object) -> str | None:
         return None
     if isinstance(value, bool):
         return "g" if value else "r"
-    lo = str(value).lower()
-    if lo in _POS or any(k in lo for k in ("\u2713", "чисто", "активн")):
+    return _text_color(str(value).lower())
+
+
+@functools.lru_cache(maxsize=2048)
+def _text_color(lo: str) -> str | None:
+    """Status color for a lowercased value string."""
+    if lo in _POS or any(k in lo for k in (_CHECK, "чисто", "активн")):
         return "g"
-    if any(k in lo for k in ("\u2717", "знайдено", "недійсн", "викрад")):
+    if any(k in lo for k in (_CROSS, "знайдено", "недійсн", "викрад")):
         return "r"
     return None
 
@@ -842,12 +1048,18 @@ def _color(key: str, value: object) -> str | None:
 def _prefix(c: str | None, text: str) -> str:
     """Prepend ✓ / ✗ based on status color."""
     if c == "g":
-        return f"\u2713 {text}"
+        return f"{_CHECK} {text}"
     if c == "r":
-        return f"\u2717 {text}"
+        return f"{_CROSS} {text}"
     return text
 
 
+def _kv_row(key: str, value: object) -> tuple[str, str, str | None]:
+    """Label, display text and color for one scalar field."""
+    c = _color(key, value)
+    return f"{_LABELS.get(key) or _humanize(key)}:", _prefix(c, _fmt(key, value)), c
+
+
 # ── Data extraction ──────────────────────────────────────────────────────────
 
 
@@ -860,14 +1072,21 @@ def _extract(data: dict) -> tuple[dict, dict]:
     scalars: dict = {}
     tables: dict = {}
 
-    def _walk(d: dict) -> None:
-        for k, v in d.items():
+    # Explicit stack of item iterators instead of recursion.  A nested
+    # wrapper is walked in place before the rest of its parent, so key
+    # order matches a recursive descent.
+    stack = [iter(data.items())]
+    while stack:
+        for k, v in stack[-1]:
+            # Interned keys hit the identity fast path in every later lookup
+            k = sys.intern(k)
             if k in _SKIP_FIELDS:
                 continue
-            if isinstance(v, dict):
+            vt = type(v)
+            if vt is dict:
                 if k in ("registry", "data"):
-                    _walk(v)
-                    continue
+                    stack.append(iter(v.items()))
+                    break
                 if k == "licenses":
                     # Flatten licenses into scalar key-value pairs
                     _LIC_FIELDS = {
@@ -900,7 +1119,7 @@ def _extract(data: dict) -> tuple[dict, dict]:
                         signer = f"{last} {first}".strip()
                     dt = v.get("dateStruct", "")
                     if parts or signer:
-                        info = ", ".join(parts) if parts else "—"
+                        info = ", ".join(parts) if parts else _DASH
                         if signer:
                             info += f" ({signer}"
                             if dt:
@@ -912,28 +1131,34 @@ def _extract(data: dict) -> tuple[dict, dict]:
                     elif any(pv is False for pk, pv in v.items() if pk in _PS_UA):
                         scalars["propertyStruct"] = "Не підписано"
                 # else: skip nested objects (e.g. address)
-            elif isinstance(v, list) and v and isinstance(v[0], dict):
+            elif vt is list and v and type(v[0]) is dict:
                 tables[k] = v
-            elif isinstance(v, list):
-                scalars[k] = v
             else:
                 scalars[k] = v
+        else:
+            stack.pop()
 
-    _walk(data)
     return scalars, tables
 
 
 def _merge(*datasets: dict) -> tuple[dict, dict]:
     """Merge multiple API response dicts; first value wins per key."""
-    all_scalars: dict = {}
-    all_tables: dict = {}
-    for ds in datasets:
-        sc, tb = _extract(ds)
-        for k, v in sc.items():
-            all_scalars.setdefault(k, v)
-        for k, v in tb.items():
-            all_tables.setdefault(k, v)
-    return all_scalars, all_tables
+    extracted = [_extract(ds) for ds in datasets]
+    return (
+        _first_wins([sc for sc, _ in extracted]),
+        _first_wins([tb for _, tb in extracted]),
+    )
+
+
+def _first_wins(dicts: list[dict]) -> dict:
+    """Union of *dicts*: earliest value wins, keys in first-seen order."""
+    if len(dicts) == 1:
+        return dicts[0]
+    out = dict.fromkeys(chain.from_iterable(dicts))
+    # updating existing keys keeps their position; the last update wins
+    for d in reversed(dicts):
+        out.update(d)
+    return out
 
 
 # ── Rendering ────────────────────────────────────────────────────────────────
@@ -941,22 +1166,25 @@ def _merge(*datasets: dict) -> tuple[dict, dict]:
 
 def _render_scalars(pdf: _ReportPDF, scalars: dict) -> None:
     """Render scalar fields grouped by _FIELD_GROUPS, then leftovers."""
-    used: set[str] = set()
+    buckets: list[list[tuple[int, str, object]]] = [[] for _ in _FIELD_GROUPS]
+    rest: list[tuple[str, object]] = []
+    for k, v in scalars.items():
+        if v == "" or v is None:
+            continue
+        g = _KEY_TO_GROUP.get(k)
+        if g is None:
+            rest.append((k, v))
+        else:
+            buckets[g[0]].append((g[1], k, v))
 
-    for title, keys in _FIELD_GROUPS:
-        pairs = [(k, scalars[k]) for k in keys if k in scalars
-                 if scalars[k] != "" and scalars[k] is not None]
-        if not pairs:
+    for (title, _), bucket in zip(_FIELD_GROUPS, buckets):
+        if not bucket:
             continue
+        bucket.sort(key=itemgetter(0))
         pdf.section(title)
-        for k, v in pairs:
-            label = _LABELS.get(k, _humanize(k))
-            c = _color(k, v)
-            pdf.kv(f"{label}:", _prefix(c, _fmt(k, v)), c)
-            used.add(k)
-
-    rest = [(k, v) for k, v in scalars.items()
-            if k not in used and v != "" and v is not None]
+        for _, k, v in bucket:
+            pdf.kv(*_kv_row(k, v))
+
     if rest:
         pdf.section("Додаткова інформація")
         for k, v in rest:
@@ -964,9 +1192,14 @@ def _render_scalars(pdf: _ReportPDF, scalars: dict) -> None:
             if k.startswith("_license_"):
                 pdf.kv("Ліцензія:", str(v))
                 continue
-            label = _LABELS.get(k, _humanize(k))
-            c = _color(k, v)
-            pdf.kv(f"{label}:", _prefix(c, _fmt(k, v)), c)
+            pdf.kv(*_kv_row(k, v))
+
+
+# Section title per table key: explicit title → field label → humanized key
+_TABLE_TITLE: dict[str, str] = {
+    k: _SECTION_TITLES.get(k) or _LABELS.get(k) or _humanize(k)
+    for k in chain(_SECTION_TITLES, _LABELS, _TABLE_CFG)
+}
 
 
 def _render_tables(pdf: _ReportPDF, tables: dict) -> None:
@@ -978,8 +1211,7 @@ def _render_tables(pdf: _ReportPDF, tables: dict) -> None:
         if key == "factors":
             _render_factors(pdf, items)
             continue
-        title = _SECTION_TITLES.get(key, _LABELS.get(key, _humanize(key)))
-        pdf.section(title)
+        pdf.section(_TABLE_TITLE.get(key) or _humanize(key))
         cfg = _TABLE_CFG.get(key)
         if cfg:
             _table_known(pdf, items, cfg)
@@ -993,25 +1225,23 @@ def _table_known(
     cfg: dict,
 ) -> None:
     """Render a table using a predefined column layout."""
-    rows: list[list[str]] = []
-    for it in items:
-        rows.append([_cell(col, it) for col in cfg["cols"]])
+    # Build column by column, then transpose into rows for add_table
+    columns = [[fn(it) for it in items] for fn in map(_cell_fn, cfg["cols"])]
+    rows = [list(r) for r in zip(*columns)]
     pdf.add_table(cfg["hdrs"], rows, widths=cfg["widths"], scol=cfg.get("scol"))
 
 
 def _table_auto(pdf: _ReportPDF, items: list[dict]) -> None:
     """Auto-detect columns and render a table from unknown data."""
-    col_keys: list[str] = []
-    for it in items:
-        for k in it:
-            if k not in col_keys and k not in _SKIP_FIELDS:
-                col_keys.append(k)
+    # Ordered, de-duplicated union of item keys (dict keeps first-seen order)
+    col_keys = list(dict.fromkeys(k for it in items for k in it if k not in _SKIP_FIELDS))
     if not col_keys:
         return
-    hdrs = [_LABELS.get(k, _humanize(k)) for k in col_keys]
+    hdrs = [_LABELS.get(k) or _humanize(k) for k in col_keys]
     n = len(col_keys)
     widths = [pdf.pw / n] * n
-    rows = [[_fmt(k, it.get(k, "\u2014")) for k in col_keys] for it in items]
+    fmt_fns = [functools.partial(_fmt, k) for k in col_keys]
+    rows = [[fn(it.get(k, _DASH)) for fn, k in zip(fmt_fns, col_keys)] for it in items]
     pdf.add_table(hdrs, rows, widths=widths)
 
 
@@ -1096,6 +1326,14 @@ _FACTOR_LABELS: dict[str, str] = {
     "government": "Державні, грн",
 }
 
+# Hot factor / table-item keys, interned once so dict probes can
+# short-circuit on identity
+_K_TYPE = sys.intern("type")
+_K_FG = sys.intern("factorGroup")
+_K_ITEMS = sys.intern("items")
+_K_COUNT = sys.intern("count")
+_K_STATUS = sys.intern("status")
+
 # Ukrainian translations for raw API English values
 _VALUE_UA: dict[str, str] = {
     # statuses
@@ -1131,18 +1369,30 @@ _VALUE_UA: dict[str, str] = {
 }
 
 
+# Casefolded view of _VALUE_UA — only consulted when the exact-case
+# lookup misses (API values are almost always already in key form)
+_VALUE_UA_FOLD: dict[str, str] = {k.casefold(): v for k, v in _VALUE_UA.items()}
+
+
 def _ua(value: object) -> str:
     """Translate a raw API value to Ukrainian if a mapping exists."""
-    s = str(value)
-    return _VALUE_UA.get(s, _VALUE_UA.get(s.lower(), s))
+    return _ua_str(value if type(value) is str else str(value))
+
+
+@functools.lru_cache(maxsize=256)
+def _ua_str(s: str) -> str:
+    v = _VALUE_UA.get(s)
+    if v is not None:
+        return v
+    return _VALUE_UA_FOLD.get(s.casefold(), s)
 
 
 def _factor_severity(factor: dict) -> str:
     """Determine card severity from factor data."""
     ind = factor.get("indicator", "")
-    fg = factor.get("factorGroup", "")
-    ftype = factor.get("type", "")
-    status = str(factor.get("status", "")).lower()
+    fg = factor.get(_K_FG, "")
+    ftype = factor.get(_K_TYPE, "")
+    status = str(factor.get(_K_STATUS, "")).lower()
 
     # Sanctions are always danger
     if fg == "sanction" or ftype == "sanction":
@@ -1162,8 +1412,8 @@ def _factor_severity(factor: dict) -> str:
 
 def _factor_title(factor: dict) -> str:
     """Build card title from factor data."""
-    ftype = factor.get("type", "")
-    fg = factor.get("factorGroup", "")
+    ftype = factor.get(_K_TYPE, "")
+    fg = factor.get(_K_FG, "")
     base = _FACTOR_TITLES.get(ftype, _FACTOR_GROUP_TITLES.get(fg, ftype or fg))
     text = factor.get("text", "")
     if text and text != base:
@@ -1173,242 +1423,239 @@ def _factor_title(factor: dict) -> str:
 
 def _factor_lines(factor: dict) -> list[str]:
     """Extract all detail lines for a factor card."""
-    lines: list[str] = []
-
     # Special: generalSystem flag
     if factor.get("generalSystem"):
-        lines.append("Система оподаткування: загальна")
-        return lines
+        return ["Система оподаткування: загальна"]
+    fn = _FACTOR_LINE_DISPATCH.get(factor.get(_K_TYPE))
+    return fn(factor) if fn else _lines_default(factor)
+
+
+def _labelled(*keys: str) -> tuple[tuple[str, str], ...]:
+    """(key, label) pairs for the *keys* that have a card label, in order."""
+    return tuple((k, _FACTOR_LABELS[k]) for k in keys if k in _FACTOR_LABELS)
+
+
+_LAWYER_FIELDS = _labelled("fullName", "certnum", "certat", "racalc", "certcalc", "region")
+_WANTED_FIELDS = _labelled(
+    "fullName", "birthDate", "sex", "articleCrim", "lostDate", "lostPlace", "ovd",
+)
+_SANCTION_FIELDS = _labelled(
+    "sanctionList", "sanctionReason", "startDate", "endDate", "termless", "duration",
+)
+_SEX_PERSON_UA: dict[str, str] = {"male": "Чоловік", "female": "Жінка"}
+
+
+def _factor_value(v: object) -> str:
+    """Display form of a factor field value."""
+    if isinstance(v, bool):
+        return "Так" if v else "Ні"
+    return _ua(v)
+
+
+def _lines_singletax(factor: dict) -> list[str]:
+    """Single tax: group, rate and start date on one line."""
+    lines: list[str] = []
+    parts = []
+    if factor.get("group"):
+        parts.append(f"Група: {factor['group']}")
+    if factor.get("rate"):
+        parts.append(f"Ставка: {factor['rate']}%")
+    if factor.get("dateStart"):
+        parts.append(f"з {factor['dateStart']}")
+    if parts:
+        lines.append(", ".join(parts))
+    return lines
+
+
+def _lines_history(factor: dict) -> list[str]:
+    """History (EDR changes) is rendered via _render_history()."""
+    return []
+
+
+# ── Person-specific factor types ──────────────────────────────────────────
+
+
+def _lines_ceo_like(factor: dict) -> list[str]:
+    """EDR roles: ceo, beneficiaries, founders — show company info."""
+    lines: list[str] = []
+    company = factor.get("fullName", "")
+    code = factor.get("code", "")
+    status = factor.get("companyStatus", "")
+    activities = factor.get("activities", "")
+    if company:
+        line = company
+        if code:
+            line += f" (ЄДРПОУ: {code})"
+        lines.append(line)
+    if status:
+        lines.append(f"Статус: {_ua(status)}")
+    if activities:
+        lines.append(f"Діяльність: {activities}")
+    return lines
+
+
+def _lines_fop(factor: dict) -> list[str]:
+    """FOP — private entrepreneur."""
+    lines: list[str] = []
+    name = factor.get("fullName", "")
+    location = factor.get("location", "")
+    activities = factor.get("activities", "")
+    status = factor.get(_K_STATUS, "")
+    if name:
+        lines.append(name)
+    if status:
+        lines.append(f"Статус: {_ua(status)}")
+    if activities:
+        lines.append(f"Діяльність: {activities}")
+    if location:
+        loc = location[:70] + _ELLIPSIS if len(location) > 70 else location
+        lines.append(f"Адреса: {loc}")
+    return lines
+
+
+def _lines_lawyer(factor: dict) -> list[str]:
+    """Lawyer certificate details."""
+    values = ((label, factor.get(k)) for k, label in _LAWYER_FIELDS)
+    # datetimes are cut to the date part
+    return [
+        f"{label}: {v.split('T')[0] if isinstance(v, str) else v}"
+        for label, v in values if v
+    ]
+
 
-    # Special: singletax details
-    if factor.get("type") == "singletax":
+def _lines_wanted(factor: dict) -> list[str]:
+    """Wanted — critical risk."""
+    values = ((k, label, factor.get(k)) for k, label in _WANTED_FIELDS)
+    return [
+        f"{label}: {_SEX_PERSON_UA.get(v, v) if k == 'sex' and isinstance(v, str) else v}"
+        for k, label, v in values if v
+    ]
+
+
+def _lines_session(factor: dict) -> list[str]:
+    """Court sessions (person) — show summary + top N."""
+    lines: list[str] = []
+    count = factor.get(_K_COUNT, len(factor.get(_K_ITEMS, [])))
+    if count:
+        lines.append(f"Всього засідань: {count}")
+    sub_items = factor.get(_K_ITEMS, [])
+    shown = min(len(sub_items), 10)
+    for si in sub_items[:shown]:
+        num = si.get("number", "")
+        date = si.get("date", "")
+        forma = si.get("forma", "")
+        judge = si.get("judge", "")
         parts = []
-        if factor.get("group"):
-            parts.append(f"Група: {factor['group']}")
-        if factor.get("rate"):
-            parts.append(f"Ставка: {factor['rate']}%")
-        if factor.get("dateStart"):
-            parts.append(f"з {factor['dateStart']}")
-        if parts:
-            lines.append(", ".join(parts))
-        return lines
-
-    # Special: history (EDR changes) — items have date+changes structure
-    if factor.get("type") == "history":
-        _FIELD_UA = {
-            "authorised_capital": "Статутний капітал",
-            "founder_capital": "Частка засновника",
-            "beneficiary": "Бенефіціарний власник",
-            "beneficiary_address": "Адреса бенефіціара",
-            "location": "Адреса",
-            "ceo_name": "Керівник",
-            "name": "Назва",
-            "status": "Статус",
-            "activity": "Вид діяльності",
-        }
-        def _short(val: str, limit: int = 50) -> str:
-            """Shorten a value, try formatting as number."""
-            if not val:
-                return ""
-            try:
-                n = int(val)
-                return f"{n:,}".replace(",", " ") + " грн"
-            except (ValueError, TypeError):
-                pass
-            if len(val) > limit:
-                return val[:limit] + "…"
-            return val
-
-        # Return empty lines — history is rendered via _render_history()
-        return lines
-
-    # ── Person-specific factor types ──────────────────────────────────────
-
-    # EDR roles: ceo, beneficiaries, founders — show company info
-    if factor.get("type") in ("ceo", "beneficiaries", "founders"):
-        company = factor.get("fullName", "")
-        code = factor.get("code", "")
-        status = factor.get("companyStatus", "")
-        activities = factor.get("activities", "")
-        if company:
-            line = company
-            if code:
-                line += f" (ЄДРПОУ: {code})"
+        if num:
+            parts.append(f"№ {num}")
+        if date:
+            parts.append(date)
+        if forma:
+            parts.append(forma)
+        header = " | ".join(parts) if parts else _DASH
+        if judge:
+            header += f"\n  Суддя: {judge}"
+        lines.append(header)
+    if len(sub_items) > shown:
+        lines.append(f"{_ELLIPSIS} та ще {len(sub_items) - shown} засідань")
+    return lines
+
+
+def _lines_court_status(factor: dict) -> list[str]:
+    """Court case statuses (person) — show summary + top N."""
+    lines: list[str] = []
+    count = factor.get(_K_COUNT, len(factor.get(_K_ITEMS, [])))
+    if count:
+        lines.append(f"Всього справ: {count}")
+    sub_items = factor.get(_K_ITEMS, [])
+    shown = min(len(sub_items), 10)
+    for si in sub_items[:shown]:
+        case_num = si.get("caseNumber", "")
+        court = si.get("courtName", "")
+        stage = si.get("stageName", "")
+        date = si.get("registrationDate", "")
+        desc = si.get("description", "")
+        parts = []
+        if case_num:
+            parts.append(f"№ {case_num}")
+        if date:
+            parts.append(date)
+        if desc:
+            short_desc = desc[:50] + _ELLIPSIS if len(desc) > 50 else desc
+            parts.append(short_desc)
+        header = " | ".join(parts) if parts else _DASH
+        if court:
+            header += f"\n  Суд: {court}"
+        if stage:
+            header += f"\n  Стадія: {stage}"
+        lines.append(header)
+    if len(sub_items) > shown:
+        lines.append(f"{_ELLIPSIS} та ще {len(sub_items) - shown} справ")
+    return lines
+
+
+def _lines_declarant_owner(factor: dict) -> list[str]:
+    """declarantOwner — public official owns company."""
+    lines: list[str] = []
+    sub_items = factor.get(_K_ITEMS, [])
+    for si in sub_items:
+        pib = si.get("pib", "")
+        years = si.get("years", [])
+        if pib:
+            yr_str = ", ".join(str(y) for y in sorted(years)) if years else ""
+            line = pib
+            if yr_str:
+                line += f" ({yr_str})"
             lines.append(line)
-        if status:
-            lines.append(f"Статус: {_ua(status)}")
-        if activities:
-            lines.append(f"Діяльність: {activities}")
-        return lines
-
-    # FOP — private entrepreneur
-    if factor.get("type") == "fop":
-        name = factor.get("fullName", "")
-        location = factor.get("location", "")
-        activities = factor.get("activities", "")
-        status = factor.get("status", "")
-        if name:
-            lines.append(name)
-        if status:
-            lines.append(f"Статус: {_ua(status)}")
-        if activities:
-            lines.append(f"Діяльність: {activities}")
-        if location:
-            loc = location[:70] + "…" if len(location) > 70 else location
-            lines.append(f"Адреса: {loc}")
-        return lines
-
-    # Lawyer
-    if factor.get("type") == "lawyer":
-        for k in ("fullName", "certnum", "certat", "racalc", "certcalc", "region"):
-            v = factor.get(k)
-            if not v:
-                continue
-            label = _FACTOR_LABELS.get(k)
-            if not label:
-                continue
-            # Clean datetime
-            if isinstance(v, str) and "T" in v:
-                v = v.split("T")[0]
-            lines.append(f"{label}: {v}")
-        return lines
-
-    # Wanted — critical risk
-    if factor.get("type") == "wanted":
-        for k in ("fullName", "birthDate", "sex", "articleCrim", "lostDate", "lostPlace", "ovd"):
-            v = factor.get(k)
-            if not v:
-                continue
-            label = _FACTOR_LABELS.get(k)
-            if not label:
-                continue
-            if k == "sex":
-                v = "Чоловік" if v == "male" else "Жінка" if v == "female" else v
-            lines.append(f"{label}: {v}")
-        return lines
-
-    # Court sessions (person) — show summary + top N
-    if factor.get("type") == "session":
-        count = factor.get("count", len(factor.get("items", [])))
-        if count:
-            lines.append(f"Всього засідань: {count}")
-        sub_items = factor.get("items", [])
-        shown = min(len(sub_items), 10)
-        for si in sub_items[:shown]:
-            num = si.get("number", "")
-            date = si.get("date", "")
-            forma = si.get("forma", "")
-            judge = si.get("judge", "")
-            parts = []
-            if num:
-                parts.append(f"№ {num}")
-            if date:
-                parts.append(date)
-            if forma:
-                parts.append(forma)
-            header = " | ".join(parts) if parts else "—"
-            if judge:
-                header += f"\n  Суддя: {judge}"
-            lines.append(header)
-        if len(sub_items) > shown:
-            lines.append(f"… та ще {len(sub_items) - shown} засідань")
-        return lines
-
-    # Court case statuses (person) — show summary + top N
-    if factor.get("type") == "courtStatus":
-        count = factor.get("count", len(factor.get("items", [])))
-        if count:
-            lines.append(f"Всього справ: {count}")
-        sub_items = factor.get("items", [])
-        shown = min(len(sub_items), 10)
-        for si in sub_items[:shown]:
-            case_num = si.get("caseNumber", "")
-            court = si.get("courtName", "")
-            stage = si.get("stageName", "")
-            date = si.get("registrationDate", "")
-            desc = si.get("description", "")
-            parts = []
-            if case_num:
-                parts.append(f"№ {case_num}")
-            if date:
-                parts.append(date)
-            if desc:
-                short_desc = desc[:50] + "…" if len(desc) > 50 else desc
-                parts.append(short_desc)
-            header = " | ".join(parts) if parts else "—"
-            if court:
-                header += f"\n  Суд: {court}"
-            if stage:
-                header += f"\n  Стадія: {stage}"
-            lines.append(header)
-        if len(sub_items) > shown:
-            lines.append(f"… та ще {len(sub_items) - shown} справ")
-        return lines
-
-    # declarantOwner — public official owns company
-    if factor.get("type") == "declarantOwner":
-        sub_items = factor.get("items", [])
-        for si in sub_items:
-            pib = si.get("pib", "")
-            years = si.get("years", [])
-            if pib:
-                yr_str = ", ".join(str(y) for y in sorted(years)) if years else ""
-                line = pib
-                if yr_str:
-                    line += f" ({yr_str})"
-                lines.append(line)
-        return lines
-
-    # Special: penalty (enforcement proceedings) — rich item structure
-    if factor.get("type") == "penalty":
-        sub_items = factor.get("items", [])
-        for idx, si in enumerate(sub_items):
-            num = si.get("number", "")
-            date = si.get("vpBeginDate", "")
-            court = si.get("courtName", "")
-            creditor = si.get("creditorName", "")
-            org = si.get("orgName", "")
-            executor = si.get("empFullFio", "")
-            header = f"Провадження {idx + 1}"
-            if num:
-                header += f"  (№ {num})"
-            if date:
-                header += f"  від {date}"
-            parts = [header]
-            if creditor:
-                parts.append(f"  Стягувач: {creditor}")
-            if court:
-                parts.append(f"  Суд: {court}")
-            if org:
-                short_org = org[:55] + "…" if len(org) > 55 else org
-                parts.append(f"  Орган ДВС: {short_org}")
-            if executor:
-                parts.append(f"  Виконавець: {executor}")
-            lines.append("\n".join(parts))
-        return lines
-
-    # Special: sanction — show details from factor fields
-    if factor.get("type") == "sanction":
-        for k in ("sanctionList", "sanctionReason", "startDate", "endDate", "termless", "duration"):
-            v = factor.get(k)
-            if v is None or v == "" or v == []:
-                continue
-            label = _FACTOR_LABELS.get(k)
-            if not label:
-                continue
-            if isinstance(v, bool):
-                v = "Так" if v else "Ні"
-            else:
-                v = _ua(v)
-            lines.append(f"{label}: {v}")
-        return lines
+    return lines
+
+
+def _lines_penalty(factor: dict) -> list[str]:
+    """Penalty (enforcement proceedings) — rich item structure."""
+    return [
+        "\n".join(_penalty_parts(n, si))
+        for n, si in enumerate(factor.get(_K_ITEMS, []), 1)
+    ]
+
+
+def _penalty_parts(n: int, si: dict) -> list[str]:
+    """Header + detail lines for one enforcement proceeding."""
+    num = si.get("number", "")
+    date = si.get("vpBeginDate", "")
+    org = si.get("orgName", "")
+    header = f"Провадження {n}"
+    if num:
+        header += f"  (№ {num})"
+    if date:
+        header += f"  від {date}"
+    details = (
+        ("Стягувач", si.get("creditorName", "")),
+        ("Суд", si.get("courtName", "")),
+        ("Орган ДВС", org[:55] + _ELLIPSIS if len(org) > 55 else org),
+        ("Виконавець", si.get("empFullFio", "")),
+    )
+    return [header, *(f"  {label}: {v}" for label, v in details if v)]
+
+
+def _lines_sanction(factor: dict) -> list[str]:
+    """Sanction — show details from factor fields."""
+    values = ((label, factor.get(k)) for k, label in _SANCTION_FIELDS)
+    return [
+        f"{label}: {_factor_value(v)}"
+        for label, v in values if v is not None and v != "" and v != []
+    ]
+
+
+def _lines_default(factor: dict) -> list[str]:
+    """Generic factor: court-style sub-items, then labelled fields."""
+    lines: list[str] = []
 
     # Special: court with sub-items
-    sub_items = factor.get("items", [])
+    sub_items = factor.get(_K_ITEMS, [])
     if sub_items and isinstance(sub_items, list):
         for si in sub_items:
-            si_text = si.get("text", si.get("type", ""))
-            si_count = si.get("count", 0)
+            si_text = si.get("text", si.get(_K_TYPE, ""))
+            si_count = si.get(_K_COUNT, 0)
             si_live = si.get("liveCount")
             detail = f"\u2022 {si_text}: {si_count}"
             if si_live is not None:
@@ -1416,23 +1663,32 @@ def _factor_lines(factor: dict) -> list[str]:
             lines.append(detail)
 
     # Render remaining fields
-    for k, v in factor.items():
-        if k in _FACTOR_SKIP:
-            continue
-        if v is None or v == "" or v == []:
-            continue
-        label = _FACTOR_LABELS.get(k)
-        if not label:
-            continue
-        if isinstance(v, bool):
-            v = "Так" if v else "Ні"
-        else:
-            v = _ua(v)
-        lines.append(f"{label}: {v}")
-
+    values = ((_FACTOR_LABELS.get(k), v) for k, v in factor.items() if k not in _FACTOR_SKIP)
+    lines.extend(
+        f"{label}: {_factor_value(v)}"
+        for label, v in values if label and v is not None and v != "" and v != []
+    )
     return lines
 
 
+# Factor type → detail-line builder (anything else → _lines_default)
+_FACTOR_LINE_DISPATCH: dict[str, Callable[[dict], list[str]]] = {
+    "singletax": _lines_singletax,
+    "history": _lines_history,
+    "ceo": _lines_ceo_like,
+    "beneficiaries": _lines_ceo_like,
+    "founders": _lines_ceo_like,
+    "fop": _lines_fop,
+    "lawyer": _lines_lawyer,
+    "wanted": _lines_wanted,
+    "session": _lines_session,
+    "courtStatus": _lines_court_status,
+    "declarantOwner": _lines_declarant_owner,
+    "penalty": _lines_penalty,
+    "sanction": _lines_sanction,
+}
+
+
 def _render_history(pdf: _ReportPDF, factor: dict) -> None:
     """Render history factor with alternating-bg date blocks."""
     _FIELD_UA = {
@@ -1452,17 +1708,17 @@ def _render_history(pdf: _ReportPDF, factor: dict) -> None:
             return ""
         try:
             n = int(val)
-            return f"{n:,}".replace(",", " ") + " грн"
+            return format(n, ",d").translate(_COMMA_TO_SPACE) + " грн"
         except (ValueError, TypeError):
             pass
         if len(val) > limit:
-            return val[:limit] + "\u2026"
+            return val[:limit] + _ELLIPSIS
         return val
 
     title = _factor_title(factor)
     blocks: list[list[str]] = []
 
-    for si in factor.get("items", []):
+    for si in factor.get(_K_ITEMS, []):
         date = si.get("date", "")
         changes = si.get("changes", [])
         if not changes:
@@ -1475,143 +1731,161 @@ def _render_history(pdf: _ReportPDF, factor: dict) -> None:
             new_val = ch.get("newValue", "")
             if new_val and old_val:
                 block.append(
-                    f"\u25b8 {ch_text}\n"
+                    f"{_TRIANGLE} {ch_text}\n"
                     f"    {_short(old_val)}  \u2192  {_short(new_val)}"
                 )
             elif new_val:
-                block.append(f"\u25b8 {ch_text}: {_short(new_val)}")
+                block.append(f"{_TRIANGLE} {ch_text}: {_short(new_val)}")
             elif old_val:
-                block.append(f"\u25b8 {ch_text}: {_short(old_val)}")
+                block.append(f"{_TRIANGLE} {ch_text}: {_short(old_val)}")
             else:
-                block.append(f"\u25b8 {ch_text}")
+                block.append(f"{_TRIANGLE} {ch_text}")
         blocks.append(block)
 
     pdf.history_card(title, blocks)
 
 
+# Card order: danger first, then warning, then info
+_SEV_ORDER: dict[str, int] = {"danger": 0, "warning": 1, "info": 2}
+
+# Factor types that only appear in person reports
+_PERSON_TYPES = frozenset({
+    "ceo", "beneficiaries", "founders", "fop", "session", "courtStatus", "lawyer",
+})
+
+# Important checks that get an explicit "not found" card when absent:
+# (factor type, factor group, card title, message)
+_ABSENT_CHECKS_COMPANY: tuple[tuple[str, str, str, str], ...] = (
+    ("sanction", "sanction", "Санкції", "Компанія не знайдена в санкційних списках"),
+    ("penalty", "court", "Виконавчі провадження", "Виконавчих проваджень не знайдено"),
+)
+_ABSENT_CHECKS_PERSON: tuple[tuple[str, str, str, str], ...] = (
+    ("sanction", "sanction", "Санкції", "Особу не знайдено в санкційних списках"),
+    ("penalty", "court", "Виконавчі провадження", "Виконавчих проваджень не знайдено"),
+    ("wanted", "risk", "Розшук", "В розшуку не перебуває"),
+)
+
+
 def _render_factors(pdf: _ReportPDF, factors: list[dict]) -> None:
     """Render factors as color-coded risk cards."""
     pdf.section("Фактори та сигнали ризику")
 
-    # Disclaimer
-    pdf.set_font("DV", "", 7.5)
-    pdf.set_text_color(*_GRAY)
-    pdf.multi_cell(
-        pdf.pw, 4,
+    pdf.note(
         "Нижче перелічено індикатори, які джерело позначає як важливі. "
-        "Це не юридична кваліфікація і не висновок про правомірність дій компанії.",
-        new_x="LMARGIN", new_y="NEXT",
+        "Це не юридична кваліфікація і не висновок про правомірність дій компанії."
     )
-    pdf.ln(3)
-    pdf.set_text_color(*_TEXT)
-
-    # Sort: danger first, then warning, then info
-    _sev_order = {"danger": 0, "warning": 1, "info": 2}
-    sorted_factors = sorted(factors, key=lambda f: _sev_order.get(_factor_severity(f), 9))
 
-    # Check which important checks are present
-    factor_types = {f.get("type", "") for f in factors}
-    factor_groups = {f.get("factorGroup", "") for f in factors}
-
-    for factor in sorted_factors:
+    # One pass: card data per factor + which important checks are present
+    prepared = []
+    factor_types: set[str] = set()
+    factor_groups: set[str] = set()
+    for f in factors:
+        factor_types.add(f.get(_K_TYPE, ""))
+        factor_groups.add(f.get(_K_FG, ""))
+        sev = _factor_severity(f)
+        prepared.append((_SEV_ORDER.get(sev, 9), sev, _factor_title(f), _factor_lines(f), f))
+    prepared.sort(key=itemgetter(0))
+
+    for _, severity, title, lines, factor in prepared:
         # History rendered with dedicated alternating-bg card
-        if factor.get("type") == "history":
+        if factor.get(_K_TYPE) == "history":
             _render_history(pdf, factor)
             continue
-        severity = _factor_severity(factor)
-        title = _factor_title(factor)
-        lines = _factor_lines(factor)
         pdf.factor_card(title, lines, severity)
 
     # Detect person report (has person-specific factor types)
-    _PERSON_TYPES = {"ceo", "beneficiaries", "founders", "fop", "session", "courtStatus", "lawyer"}
-    is_person = bool(factor_types & _PERSON_TYPES)
+    is_person = not _PERSON_TYPES.isdisjoint(factor_types)
 
     # Explicit "not found" cards for important checks that are absent
-    _ABSENT_CHECKS = [
-        ("sanction", "sanction", "Санкції",
-         "Особу не знайдено в санкційних списках" if is_person else "Компанія не знайдена в санкційних списках"),
-        ("penalty", "court", "Виконавчі провадження", "Виконавчих проваджень не знайдено"),
-    ]
-    if is_person:
-        _ABSENT_CHECKS.append(
-            ("wanted", "risk", "Розшук", "В розшуку не перебуває")
-        )
-    for ftype, fgroup, title, msg in _ABSENT_CHECKS:
+    checks = _ABSENT_CHECKS_PERSON if is_person else _ABSENT_CHECKS_COMPANY
+    for ftype, fgroup, title, msg in checks:
         if ftype not in factor_types and (fgroup is None or fgroup not in factor_groups or ftype != fgroup):
-            pdf.factor_card(f"\u2713 {title}", [msg], "info")
+            pdf.factor_card(f"{_CHECK} {title}", [msg], "info")
 
 
 def _cell(col: str, item: dict) -> str:
     """Produce a cell value for a known-table column (incl. virtual cols)."""
-    if col == "_desc":
-        return str(
-            item.get("description")
-            or _REG_TYPE_UA.get(item.get("type", ""), item.get("type", ""))
-        )
-    if col == "_type_ua":
-        raw = item.get("type", "")
-        return _REGISTRY_UA.get(raw, _REG_TYPE_UA.get(raw, raw))
-    if col == "_status_display":
-        return _item_status(item)
-    if col == "_benef_name":
-        bn = item.get("beneficiaryName", "")
-        name = item.get("name", "")
-        if bn and bn != name:
-            return f"{name}\n({bn})"
-        return name or "\u2014"
-    if col in ("_revenue_fmt", "_profit_fmt", "_assets_fmt", "_amount_fmt",
-               "_expenses_fmt", "_balance_fmt", "_liability_fmt",
-               "_nonCurrentAssets_fmt", "_currentAssets_fmt"):
-        raw_key = col.replace("_fmt", "").lstrip("_")
-        v = item.get(raw_key, 0)
-        try:
-            return f"{int(v):,}".replace(",", " ")
-        except (ValueError, TypeError):
-            return str(v) if v else "\u2014"
-    if col in ("_payee_fmt", "_payer_fmt"):
-        raw_key = col.replace("_fmt", "").lstrip("_") + "_amount"
-        v = item.get(raw_key, 0)
-        try:
-            fv = float(v)
-            if fv == 0:
-                return "\u2014"
-            return f"{fv:,.2f}".replace(",", " ")
-        except (ValueError, TypeError):
-            return str(v) if v else "\u2014"
-    if col == "_value_fmt":
-        v = item.get("value", 0)
-        try:
-            return f"{int(v):,}".replace(",", " ")
-        except (ValueError, TypeError):
-            return str(v) if v else "\u2014"
-    if col in ("_date_start_fmt", "_date_end_fmt"):
-        raw_key = "date_start" if "start" in col else "date_end"
-        v = item.get(raw_key, "")
-        if not v:
-            return "\u2014"
-        try:
-            from datetime import datetime as _dt
-            ts = int(v)
-            return _dt.fromtimestamp(ts).strftime("%d.%m.%Y")
-        except (ValueError, TypeError, OSError):
-            return str(v)
-    if col == "_factor_status":
-        s = str(item.get("status", "\u2014"))
-        return ("\u2713 " + s.capitalize()) if s.lower() in _POS else s
-    if col == "isPrimary":
-        return "\u2713 Так" if item.get(col) else "Ні"
-    if col == "rate":
-        v = item.get(col, "\u2014")
-        return f"{v}%" if v != "\u2014" else "\u2014"
-    return str(item.get(col, "\u2014"))
+    fn = _CELL_HANDLERS.get(col)
+    return fn(item) if fn else str(item.get(col, _DASH))
+
+
+def _cell_fn(col: str):
+    """Resolve the cell formatter for *col* once (for column-wise loops)."""
+    return _CELL_HANDLERS.get(col) or functools.partial(_cell_raw, col)
+
+
+def _cell_raw(col: str, item: dict) -> str:
+    return str(item.get(col, _DASH))
+
+
+def _cell_desc(item: dict) -> str:
+    return str(
+        item.get("description")
+        or _REG_TYPE_UA.get(item.get(_K_TYPE, ""), item.get(_K_TYPE, ""))
+    )
+
+
+def _cell_type_ua(item: dict) -> str:
+    raw = item.get(_K_TYPE, "")
+    return _REGISTRY_UA.get(raw, _REG_TYPE_UA.get(raw, raw))
+
+
+def _cell_benef(item: dict) -> str:
+    bn = item.get("beneficiaryName", "")
+    name = item.get("name", "")
+    if bn and bn != name:
+        return f"{name}\n({bn})"
+    return name or _DASH
+
+
+def _cell_int_fmt(raw_key: str, item: dict) -> str:
+    v = item.get(raw_key, 0)
+    try:
+        return format(int(v), ",d").translate(_COMMA_TO_SPACE)
+    except (ValueError, TypeError):
+        return str(v) if v else _DASH
+
+
+def _cell_money_fmt(raw_key: str, item: dict) -> str:
+    v = item.get(raw_key, 0)
+    try:
+        fv = float(v)
+        if fv == 0:
+            return _DASH
+        return format(fv, ",.2f").translate(_COMMA_TO_SPACE)
+    except (ValueError, TypeError):
+        return str(v) if v else _DASH
+
+
+def _cell_date(raw_key: str, item: dict) -> str:
+    v = item.get(raw_key, "")
+    if not v:
+        return _DASH
+    try:
+        return _fmt_ts(int(v))
+    except (ValueError, TypeError, OSError):
+        return str(v)
+
+
+def _cell_factor_status(item: dict) -> str:
+    s = str(item.get(_K_STATUS, _DASH))
+    return f"{_CHECK} {s.capitalize()}" if s.lower() in _POS else s
+
+
+def _cell_is_primary(item: dict) -> str:
+    return f"{_CHECK} Так" if item.get("isPrimary") else "Ні"
+
+
+def _cell_rate(item: dict) -> str:
+    v = item.get("rate", _DASH)
+    return f"{v}%" if v != _DASH else _DASH
 
 
 def _item_status(item: dict) -> str:
     """Build display string for a registry-check item."""
-    cnt = item.get("count", 0)
-    itype = item.get("type", "")
-    s = item.get("status")
+    cnt = item.get(_K_COUNT, 0)
+    itype = item.get(_K_TYPE, "")
+    s = item.get(_K_STATUS)
     
     if itype == "fop" and s:
         # FOP: show registration status (informational)
@@ -1622,7 +1896,30 @@ def _item_status(item: dict) -> str:
         return f"Знайдено ({cnt})" if cnt > 0 else "Не знайдено"
     
     # Negative registries: clean is good, found is bad
-    return "\u2713 Чисто" if cnt == 0 else f"\u2717 Знайдено ({cnt})"
+    return f"{_CHECK} Чисто" if cnt == 0 else f"{_CROSS} Знайдено ({cnt})"
+
+
+# Virtual / specially formatted column → cell formatter (item → str)
+_CELL_HANDLERS: dict[str, Callable[[dict], str]] = {
+    "_desc": _cell_desc,
+    "_type_ua": _cell_type_ua,
+    "_status_display": _item_status,
+    "_benef_name": _cell_benef,
+    "_value_fmt": functools.partial(_cell_int_fmt, "value"),
+    "_payee_fmt": functools.partial(_cell_money_fmt, "payee_amount"),
+    "_payer_fmt": functools.partial(_cell_money_fmt, "payer_amount"),
+    "_date_start_fmt": functools.partial(_cell_date, "date_start"),
+    "_date_end_fmt": functools.partial(_cell_date, "date_end"),
+    "_factor_status": _cell_factor_status,
+    "isPrimary": _cell_is_primary,
+    "rate": _cell_rate,
+}
+_CELL_HANDLERS.update({
+    c: functools.partial(_cell_int_fmt, c.replace("_fmt", "").lstrip("_"))
+    for c in ("_revenue_fmt", "_profit_fmt", "_assets_fmt", "_amount_fmt",
+              "_expenses_fmt", "_balance_fmt", "_liability_fmt",
+              "_nonCurrentAssets_fmt", "_currentAssets_fmt")
+})
 
 
 # ── PDF build ────────────────────────────────────────────────────────────────
@@ -1640,7 +1937,7 @@ def _build(
     scalars, tables = _merge(*datasets)
 
     if code is None:
-        code = str(scalars.get("code", "\u2014"))
+        code = str(scalars.get("code", _DASH))
 
     pdf.banner(title, code)
     _render_scalars(pdf, scalars)
@@ -1,6 +1,8 @@
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Dict, Any, List, Optional, Pattern, Tuple
 from src.config import settings
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
@@ -12,6 +14,87 @@ class ThreatLevel:
     LOW = "LOW"
 
 
+# Case-form token → (case_category, analysis note), in priority order
+_CASE_CATEGORIES = (
+    ('кримінальн', "criminal", "Кримінальне провадження"),
+    ('господарськ', "commercial", "Господарське судочинство"),
+    ('адміністративн', "administrative", "Адміністративне судочинство"),
+    ('цивільн', "civil", "Цивільне судочинство"),
+)
+
+# Branches are tried in order, each over the whole string, so an earlier
+# token wins wherever it occurs — same as the old if/elif chain
+_CATEGORY_RE = re.compile(
+    "^(?:" + "|".join(f".*?({re.escape(t)})" for t, _, _ in _CASE_CATEGORIES) + ")",
+    re.S,
+)
+
+
+@lru_cache(maxsize=256)
+def _category_row(case_form: str) -> Optional[int]:
+    """
+    Index into _CASE_CATEGORIES for a lowercased case form, or None.
+    Forms come from a small fixed vocabulary, so after warm-up this is a
+    dict hit instead of a scan.
+    """
+    m = _CATEGORY_RE.match(case_form)
+    return m.lastindex - 1 if m else None
+
+
+@lru_cache(maxsize=4)
+def _dangerous_matcher(raw: str) -> Tuple[List[str], Pattern]:
+    """
+    Compile the DANGEROUS_PLAINTIFFS setting into one alternation regex.
+    Keyed by the raw setting string, so a changed setting gets a new matcher.
+    """
+    patterns = [x.strip().lower() for x in raw.split(",")]
+    return patterns, re.compile("|".join(map(re.escape, patterns)))
+
+
+@lru_cache(maxsize=256)
+def _classify(
+    row: Optional[int], role: str, dangerous_pattern: Optional[str],
+) -> Tuple[str, str, str, bool, bool, Tuple[str, ...]]:
+    """
+    Verdict for a case category row, the company's role and the first
+    dangerous-plaintiff pattern found (or None), memoized. The key space is
+    categories × roles × configured patterns — a few dozen entries — so
+    after warm-up every case is a hit.
+    """
+    result = {
+        "threat_level": ThreatLevel.MEDIUM,
+        "company_role": role,
+        "case_category": "civil",
+        "dangerous_plaintiff": False,
+        "is_criminal": False,
+        "analysis_notes": []
+    }
+    
+    # Determine case category from form/type
+    if row is not None:
+        _, category, note = _CASE_CATEGORIES[row]
+        result["case_category"] = category
+        result["analysis_notes"].append(note)
+        if category == "criminal":
+            result["is_criminal"] = True
+            result["threat_level"] = ThreatLevel.CRITICAL
+    
+    if role == "plaintiff" and not result["is_criminal"]:
+        result["threat_level"] = ThreatLevel.LOW
+    
+    # Check for dangerous plaintiffs (only if not already CRITICAL)
+    if dangerous_pattern is not None and not result["is_criminal"]:
+        result["dangerous_plaintiff"] = True
+        result["threat_level"] = ThreatLevel.HIGH
+        result["analysis_notes"].append(f"Держорган: {dangerous_pattern}")
+    
+    return (
+        result["threat_level"], result["company_role"], result["case_category"],
+        result["dangerous_plaintiff"], result["is_criminal"],
+        tuple(result["analysis_notes"]),
+    )
+
+
 def analyze_threat(case_data: Dict[str, Any], company_edrpou: str) -> Dict[str, Any]:
     """
     Analyze court case and determine threat level.
@@ -25,99 +108,84 @@ def analyze_threat(case_data: Dict[str, Any], company_edrpou: str) -> Dict[str,
     Returns:
         Dict with threat_level, company_role, case_category and analysis details
     """
-    result = {
-        "threat_level": ThreatLevel.MEDIUM,
-        "company_role": "defendant",  # Default for monitoring
-        "case_category": "civil",
-        "dangerous_plaintiff": False,
-        "is_criminal": False,
-        "analysis_notes": []
-    }
-    
-    # Determine case category from form/type
     case_form = (case_data.get('case_type_name') or case_data.get('form') or '').lower()
-    
-    if 'кримінальн' in case_form:
-        result["is_criminal"] = True
-        result["case_category"] = "criminal"
-        result["threat_level"] = ThreatLevel.CRITICAL
-        result["analysis_notes"].append("Кримінальне провадження")
-    elif 'господарськ' in case_form:
-        result["case_category"] = "commercial"
-        result["analysis_notes"].append("Господарське судочинство")
-    elif 'адміністративн' in case_form:
-        result["case_category"] = "administrative"
-        result["analysis_notes"].append("Адміністративне судочинство")
-    elif 'цивільн' in case_form:
-        result["case_category"] = "civil"
-        result["analysis_notes"].append("Цивільне судочинство")
-    
-    # Determine company role if parties info available
     plaintiff = (case_data.get('plaintiff') or '').lower()
     defendant = (case_data.get('defendant') or '').lower()
     
+    # Determine company role if parties info available
+    role = "defendant"  # Default for monitoring
     if plaintiff or defendant:
-        if company_edrpou in defendant or _contains_company_by_edrpou(defendant, company_edrpou):
-            result["company_role"] = "defendant"
-        elif company_edrpou in plaintiff or _contains_company_by_edrpou(plaintiff, company_edrpou):
-            result["company_role"] = "plaintiff"
-            if not result["is_criminal"]:
-                result["threat_level"] = ThreatLevel.LOW
+        if _contains_company_by_edrpou(defendant.replace(' ', ''), company_edrpou):
+            role = "defendant"
+        elif _contains_company_by_edrpou(plaintiff.replace(' ', ''), company_edrpou):
+            role = "plaintiff"
         else:
-            result["company_role"] = "party"
+            role = "party"
     
-    # Check for dangerous plaintiffs (only if not already CRITICAL)
-    if not result["is_criminal"]:
-        for pattern in settings.dangerous_plaintiffs_list:
-            if pattern in plaintiff:
-                result["dangerous_plaintiff"] = True
-                result["threat_level"] = ThreatLevel.HIGH
-                result["analysis_notes"].append(f"Держорган: {pattern}")
-                break
+    # One scan rejects the common case; on a hit report the first pattern
+    # in settings order, as before
+    patterns, matcher = _dangerous_matcher(settings.DANGEROUS_PLAINTIFFS)
+    dangerous_pattern = None
+    if matcher.search(plaintiff):
+        dangerous_pattern = next(p for p in patterns if p in plaintiff)
     
-    return result
+    level, role, category, dangerous, criminal, notes = _classify(
+        _category_row(case_form), role, dangerous_pattern,
+    )
+    return {
+        "threat_level": level,
+        "company_role": role,
+        "case_category": category,
+        "dangerous_plaintiff": dangerous,
+        "is_criminal": criminal,
+        "analysis_notes": list(notes),
+    }
+
+
+def _contains_company_by_edrpou(text_ns: str, edrpou: str) -> bool:
+    """Check if space-stripped text mentions EDRPOU"""
+    return edrpou in text_ns
 
 
-def _contains_company_by_edrpou(text: str, edrpou: str) -> bool:
-    """Check if text mentions EDRPOU"""
-    return edrpou in text.replace(' ', '')
+_CASE_TYPE_NAMES = {
+    1: "Цивільні справи",
+    2: "Кримінальні справи",
+    3: "Господарські справи",
+    4: "Адміністративні справи",
+    5: "Справи про адмінправопорушення"
+}
 
 
 def _get_case_type_name(case_type: int) -> str:
     """Get human-readable case type name"""
-    types = {
-        1: "Цивільні справи",
-        2: "Кримінальні справи",
-        3: "Господарські справи",
-        4: "Адміністративні справи",
-        5: "Справи про адмінправопорушення"
-    }
-    return types.get(case_type, f"Тип {case_type}")
+    return _CASE_TYPE_NAMES.get(case_type, f"Тип {case_type}")
+
+
+_THREAT_EMOJI = {
+    ThreatLevel.CRITICAL: "🚨",
+    ThreatLevel.HIGH: "⚠️",
+    ThreatLevel.MEDIUM: "📋",
+    ThreatLevel.LOW: "ℹ️"
+}
+
+_ROLES_UA = {
+    "defendant": "ВІДПОВІДАЧ",
+    "plaintiff": "ПОЗИВАЧ",
+    "third_party": "Третя сторона"
+}
+
+_ROLES_RU = {
+    "defendant": "ОТВЕТЧИК",
+    "plaintiff": "ИСТЕЦ",
+    "third_party": "Третья сторона"
+}
 
 
 def get_threat_emoji(threat_level: str) -> str:
     """Get emoji for threat level"""
-    emojis = {
-        ThreatLevel.CRITICAL: "🚨",
-        ThreatLevel.HIGH: "⚠️",
-        ThreatLevel.MEDIUM: "📋",
-        ThreatLevel.LOW: "ℹ️"
-    }
-    return emojis.get(threat_level, "📋")
+    return _THREAT_EMOJI.get(threat_level, "📋")
 
 
 def get_role_description(role: str, lang: str = "ua") -> str:
     """Get human-readable role description"""
-    if lang == "ua":
-        roles = {
-            "defendant": "ВІДПОВІДАЧ",
-            "plaintiff": "ПОЗИВАЧ",
-            "third_party": "Третя сторона"
-        }
-    else:
-        roles = {
-            "defendant": "ОТВЕТЧИК",
-            "plaintiff": "ИСТЕЦ", 
-            "third_party": "Третья сторона"
-        }
-    return roles.get(role, role)
+    return (_ROLES_UA if lang == "ua" else _ROLES_RU).get(role, role)
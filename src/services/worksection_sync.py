@@ -1,13 +1,17 @@
-from typing import List, Tuple
+from typing import List, Set, Tuple
 from src.clients import WorksectionClient, GistClient
-from src.storage import AsyncSessionLocal, WorksectionCaseRepository, SyncStateRepository
+from src.storage import get_uow, WorksectionCaseRepository, SyncStateRepository
 from src.utils import extract_case_numbers
 from src.config import settings
-from datetime import datetime
+from datetime import datetime, timezone
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
 
+# Tasks buffered before extraction and upsert
+EXTRACT_CHUNK = 500
+
 
 def is_gist_mode() -> bool:
     """Check if Gist mode is enabled (secure mode without WS API key)."""
@@ -20,42 +24,82 @@ async def sync_from_gist() -> int:
     Used when WORKSECTION_GIST_ID is configured.
     
     Returns:
-        Number of cases processed
+        Number of new cases stored
     """
     gist_client = GistClient(settings.WORKSECTION_GIST_ID)
     
-    async with AsyncSessionLocal() as session:
+    logger.info("Starting Gist sync (secure mode)...")
+    
+    case_numbers = await gist_client.get_case_numbers(use_cache=False)
+    logger.info(f"Fetched {len(case_numbers)} case numbers from Gist")
+    
+    async with get_uow() as session:
         ws_repo = WorksectionCaseRepository(session)
         sync_repo = SyncStateRepository(session)
         
-        logger.info("Starting Gist sync (secure mode)...")
-        
-        case_numbers = await gist_client.get_case_numbers(use_cache=False)
-        logger.info(f"Fetched {len(case_numbers)} case numbers from Gist")
-        
-        processed = 0
-        for case_number in case_numbers:
-            try:
-                await ws_repo.upsert_case(
-                    normalized_case_number=case_number,
-                    task_id="gist",
-                    raw_name=case_number,
-                    project_id="gist",
-                    project_name="Gist Sync"
-                )
-                processed += 1
-            except Exception as e:
-                logger.error(f"Error saving case {case_number}: {e}")
+        inserted = await ws_repo.insert_new_cases([
+            {
+                'normalized_case_number': case_number,
+                'task_id': "gist",
+                'raw_name': case_number,
+                'project_id': "gist",
+                'project_name': "Gist Sync",
+            }
+            for case_number in case_numbers
+        ])
         
         # Update sync timestamp
         await sync_repo.set_state(
             'worksection_last_sync',
-            datetime.utcnow().isoformat()
+            datetime.now(timezone.utc).isoformat()
         )
-        
-        logger.info(f"Gist sync completed: {processed} cases processed")
     
-    return processed
+    logger.info(f"Gist sync completed: {inserted} new cases")
+    
+    return inserted
+
+
+def _task_rows(tasks: List[dict], seen: Set[Tuple[str, str]]) -> List[dict]:
+    """
+    Build worksection_cases rows for every case number in the task names.
+    Pairs already in seen are skipped; new ones are added to it.
+    """
+    rows = []
+    for task in tasks:
+        task_id = str(task.get('id', ''))
+        task_name = task.get('name', '')
+        project = task.get('project', {})
+        project_id = str(project.get('id', ''))
+        project_name = project.get('name', '')
+        
+        # Extract case numbers from task name
+        case_numbers = extract_case_numbers(task_name)
+        
+        for case_number in case_numbers:
+            key = (case_number, task_id)
+            if key in seen:
+                continue
+            seen.add(key)
+            rows.append({
+                'normalized_case_number': case_number,
+                'task_id': task_id,
+                'raw_name': task_name,
+                'project_id': project_id,
+                'project_name': project_name,
+            })
+    return rows
+
+
+async def _save_tasks(tasks: List[dict], seen: Set[Tuple[str, str]]) -> int:
+    """
+    Extract case numbers off the event loop and upsert the unseen ones.
+    Each chunk commits on its own, so no transaction spans the API paging.
+    """
+    if not tasks:
+        return 0
+    rows = await asyncio.to_thread(_task_rows, tasks, seen)
+    async with get_uow() as session:
+        return await WorksectionCaseRepository(session).bulk_upsert_cases(rows)
 
 
 async def sync_worksection_cases() -> int:
@@ -72,48 +116,34 @@ async def sync_worksection_cases() -> int:
     
     # Direct API mode
     client = WorksectionClient()
+    
+    logger.info("Starting Worksection sync...")
+    
+    # Stream tasks project by project; extract and write a chunk at a time
+    fetched = 0
     processed = 0
+    buffer: List[dict] = []
+    seen: Set[Tuple[str, str]] = set()
+    async for task in client.iter_all_tasks(extra="text"):
+        fetched += 1
+        buffer.append(task)
+        if len(buffer) >= EXTRACT_CHUNK:
+            processed += await _save_tasks(buffer, seen)
+            buffer = []
+    processed += await _save_tasks(buffer, seen)
+    logger.info(f"Fetched {fetched} tasks from Worksection")
     
-    async with AsyncSessionLocal() as session:
-        ws_repo = WorksectionCaseRepository(session)
-        sync_repo = SyncStateRepository(session)
-        
-        logger.info("Starting Worksection sync...")
-        
-        # Get all tasks
-        tasks = await client.get_all_tasks(extra="text")
-        logger.info(f"Fetched {len(tasks)} tasks from Worksection")
-        
-        for task in tasks:
-            task_id = str(task.get('id', ''))
-            task_name = task.get('name', '')
-            project = task.get('project', {})
-            project_id = str(project.get('id', ''))
-            project_name = project.get('name', '')
-            
-            # Extract case numbers from task name
-            case_numbers = extract_case_numbers(task_name)
-            
-            for case_number in case_numbers:
-                try:
-                    await ws_repo.upsert_case(
-                        normalized_case_number=case_number,
-                        task_id=task_id,
-                        raw_name=task_name,
-                        project_id=project_id,
-                        project_name=project_name
-                    )
-                    processed += 1
-                except Exception as e:
-                    logger.error(f"Error saving case {case_number}: {e}")
-        
-        # Update sync timestamp
-        await sync_repo.set_state(
+    # Update sync timestamp
+    async with get_uow() as session:
+        await SyncStateRepository(session).set_state(
             'worksection_last_sync',
-            datetime.utcnow().isoformat()
+            datetime.now(timezone.utc).isoformat()
         )
-        
-        logger.info(f"Worksection sync completed: {processed} cases processed")
+    
+    logger.info(
+        f"Worksection sync completed: {processed} cases processed "
+        f"({len(seen)} unique case/task pairs)"
+    )
     
     return processed
 
@@ -122,6 +152,6 @@ async def get_worksection_case_numbers() -> List[str]:
     """
     Get all case numbers from Worksection database.
     """
-    async with AsyncSessionLocal() as session:
+    async with get_uow() as session:
         repo = WorksectionCaseRepository(session)
         return await repo.get_all_case_numbers()
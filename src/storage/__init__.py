@@ -1,4 +1,4 @@
-from .database import init_db, get_db, AsyncSessionLocal
+from .database import init_db, get_db, get_uow, AsyncSessionLocal
 from .models import (
     MonitoredCompany, OpenDataBotSubscription, WorksectionCase,
     CourtCase, NotificationSent, SyncState, CaseStatus, UserSubscription,
@@ -8,16 +8,16 @@ from .repository import (
     CompanyRepository, SubscriptionRepository, WorksectionCaseRepository,
     CourtCaseRepository, NotificationRepository, SyncStateRepository,
     UserSubscriptionRepository, UserSettingsRepository, CaseSubscriptionRepository,
-    BotUserRepository
+    BotUserRepository, DispatchRepository
 )
 
 __all__ = [
-    "init_db", "get_db", "AsyncSessionLocal",
+    "init_db", "get_db", "get_uow", "AsyncSessionLocal",
     "MonitoredCompany", "OpenDataBotSubscription", "WorksectionCase",
     "CourtCase", "NotificationSent", "SyncState", "CaseStatus", "UserSubscription",
     "UserSettings", "CaseSubscription", "BotUser",
     "CompanyRepository", "SubscriptionRepository", "WorksectionCaseRepository",
     "CourtCaseRepository", "NotificationRepository", "SyncStateRepository",
     "UserSubscriptionRepository", "UserSettingsRepository", "CaseSubscriptionRepository",
-    "BotUserRepository"
+    "BotUserRepository", "DispatchRepository"
 ]
@@ -1,5 +1,8 @@
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
 from sqlalchemy import event
+import orjson
 from src.config import settings
 from src.storage.models import Base
 import logging
@@ -18,12 +21,52 @@ def get_async_url(url: str) -> str:
 
 async_url = get_async_url(settings.DATABASE_URL)
 
+engine_kwargs = {}
+if async_url.startswith("mysql"):
+    # Keep connections warm through bulk sync instead of reconnecting
+    engine_kwargs.update(pool_size=20, max_overflow=40, pool_recycle=1800)
+
+def _json_serializer(value) -> str:
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+
 engine = create_async_engine(
     async_url,
     echo=False,
     pool_pre_ping=True,
+    # JSON columns (raw_data, edrpou_matches) go through orjson both ways
+    json_serializer=_json_serializer,
+    json_deserializer=orjson.loads,
+    **engine_kwargs,
 )
 
+# SQLite tuning: WAL lets readers run alongside the sync writer, and
+# synchronous=NORMAL is durable under WAL while skipping most fsyncs
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA busy_timeout=5000",
+)
+
+if async_url.startswith("sqlite"):
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+        # The driver only opens a transaction before DML, so a leading
+        # SAVEPOINT would run as its own transaction and RELEASE would
+        # commit it. Leave BEGIN to SQLAlchemy instead (see below).
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine.sync_engine, "begin")
+    def _begin_sqlite_transaction(conn):
+        conn.exec_driver_sql("BEGIN")
+
 AsyncSessionLocal = async_sessionmaker(
     engine,
     class_=AsyncSession,
@@ -31,10 +74,18 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+def _create_missing_indexes(conn):
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(conn, checkfirst=True)
+
+
 async def init_db():
     """Initialize database tables"""
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
+        # create_all skips existing tables — add indexes introduced later
+        await conn.run_sync(_create_missing_indexes)
     logger.info("Database initialized")
 
 
@@ -44,6 +95,21 @@ async def get_session() -> AsyncSession:
         yield session
 
 
+@asynccontextmanager
+async def get_uow() -> AsyncIterator[AsyncSession]:
+    """Unit of work: repositories only flush, the whole block commits once on exit.
+    
+    Rolls back instead if the block raises.
+    """
+    async with AsyncSessionLocal() as session:
+        try:
+            yield session
+        except BaseException:
+            await session.rollback()
+            raise
+        await session.commit()
+
+
 class DatabaseManager:
     """Context manager for database operations"""
     
@@ -2,14 +2,78 @@ from datetime import datetime
 from typing import Optional, List
 from sqlalchemy import (
     Column, Integer, String, Text, Boolean, DateTime, 
-    Enum, JSON, DECIMAL, Date, Index, UniqueConstraint
+    Enum, JSON, DECIMAL, Date, Index, UniqueConstraint, text
 )
+from sqlalchemy.exc import CompileError
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column
+from sqlalchemy.sql.functions import FunctionElement
 import enum
 
 
 class Base(DeclarativeBase):
-    pass
+    # Timestamps are stamped by utcnow() inside the statement; fetch them
+    # back on flush so instances never hold expired attributes.
+    __mapper_args__ = {"eager_defaults": True}
+
+
+class utcnow(FunctionElement):
+    """Current UTC time, evaluated by the database inside the statement."""
+    type = DateTime()
+    inherit_cache = True
+
+
+@compiles(utcnow)
+def _utcnow_default(element, compiler, **kw):
+    return "CURRENT_TIMESTAMP"
+
+
+@compiles(utcnow, "sqlite")
+def _utcnow_sqlite(element, compiler, **kw):
+    # UTC, in the same "YYYY-MM-DD HH:MM:SS.ffffff" text SQLAlchemy binds for
+    # datetimes, so server-stamped values compare correctly with parameters
+    return "STRFTIME('%Y-%m-%d %H:%M:%f000', 'now')"
+
+
+@compiles(utcnow, "mysql")
+def _utcnow_mysql(element, compiler, **kw):
+    return "UTC_TIMESTAMP()"
+
+
+@compiles(utcnow, "postgresql")
+def _utcnow_postgresql(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+
+class json_array_contains(FunctionElement):
+    """True when a JSON array column holds the given string as an element."""
+    type = Boolean()
+    inherit_cache = True
+
+
+@compiles(json_array_contains)
+def _json_array_contains_default(element, compiler, **kw):
+    raise CompileError(
+        f"json_array_contains is not supported on {compiler.dialect.name}"
+    )
+
+
+@compiles(json_array_contains, "sqlite")
+def _json_array_contains_sqlite(element, compiler, **kw):
+    column, value = (compiler.process(c, **kw) for c in element.clauses)
+    return f"EXISTS (SELECT 1 FROM json_each({column}) WHERE json_each.value = {value})"
+
+
+@compiles(json_array_contains, "mysql")
+def _json_array_contains_mysql(element, compiler, **kw):
+    column, value = (compiler.process(c, **kw) for c in element.clauses)
+    return f"JSON_CONTAINS({column}, JSON_QUOTE({value}))"
+
+
+@compiles(json_array_contains, "postgresql")
+def _json_array_contains_postgresql(element, compiler, **kw):
+    column, value = (compiler.process(c, **kw) for c in element.clauses)
+    return f"(CAST({column} AS JSONB) @> jsonb_build_array({value}))"
 
 
 class CompanyRole(enum.Enum):
@@ -34,8 +98,8 @@ class MonitoredCompany(Base):
     company_name: Mapped[Optional[str]] = mapped_column(String(255))
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
     added_by_user_id: Mapped[Optional[int]] = mapped_column(Integer)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow(), onupdate=utcnow())
 
 
 class OpenDataBotSubscription(Base):
@@ -48,7 +112,7 @@ class OpenDataBotSubscription(Base):
     subscription_type: Mapped[str] = mapped_column(String(50), nullable=False)
     subscription_key: Mapped[str] = mapped_column(String(100))
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow())
     last_checked_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
 
 
@@ -62,10 +126,11 @@ class WorksectionCase(Base):
     task_id: Mapped[str] = mapped_column(String(20), nullable=False)
     project_id: Mapped[Optional[str]] = mapped_column(String(20))
     project_name: Mapped[Optional[str]] = mapped_column(String(255))
-    synced_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    synced_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow())
     
     __table_args__ = (
         UniqueConstraint('normalized_case_number', 'task_id', name='uq_case_task'),
+        Index('ix_ws_case_task_covering', 'normalized_case_number', 'task_id', 'project_id'),
     )
 
 
@@ -98,7 +163,8 @@ class CourtCase(Base):
     judge: Mapped[Optional[str]] = mapped_column(String(255))
     source_link: Mapped[Optional[str]] = mapped_column(String(500))
     edrpou_matches: Mapped[Optional[str]] = mapped_column(JSON)
-    raw_data: Mapped[Optional[str]] = mapped_column(JSON)
+    # Full API payload — write-mostly, so list queries skip loading/parsing it
+    raw_data: Mapped[Optional[str]] = mapped_column(JSON, deferred=True)
     
     # Status tracking
     status: Mapped[str] = mapped_column(String(20), default="new")
@@ -107,12 +173,17 @@ class CourtCase(Base):
     worksection_task_id: Mapped[Optional[str]] = mapped_column(String(20))
     
     # Timestamps
-    fetched_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    fetched_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow())
     notified_at: Mapped[Optional[datetime]] = mapped_column(DateTime)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow(), onupdate=utcnow())
     
     __table_args__ = (
         Index('ix_case_number_court', 'normalized_case_number', 'court_code'),
+        Index('ix_court_case_status_threat', 'status', 'threat_level', 'normalized_case_number'),
+        # Newest-first keyset pages in get_recent_cases / get_cases_by_status / _by_threat_level
+        Index('ix_court_case_fetched', 'fetched_at'),
+        Index('ix_court_case_status_fetched', 'status', 'fetched_at'),
+        Index('ix_court_case_threat_fetched', 'threat_level', 'fetched_at'),
     )
 
 
@@ -127,7 +198,11 @@ class NotificationSent(Base):
     telegram_message_id: Mapped[Optional[str]] = mapped_column(String(50))
     telegram_chat_id: Mapped[Optional[str]] = mapped_column(String(50))
     payload_hash: Mapped[Optional[str]] = mapped_column(String(64))
-    sent_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    sent_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow())
+    
+    __table_args__ = (
+        Index('ix_notif_case_threat', 'normalized_case_number', 'threat_level', 'sent_at'),
+    )
 
 
 class SyncState(Base):
@@ -137,7 +212,7 @@ class SyncState(Base):
     id: Mapped[int] = mapped_column(primary_key=True)
     key_name: Mapped[str] = mapped_column(String(50), unique=True, nullable=False)
     value: Mapped[Optional[str]] = mapped_column(Text)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow(), onupdate=utcnow())
 
 
 class UserSubscription(Base):
@@ -148,10 +223,13 @@ class UserSubscription(Base):
     user_id: Mapped[int] = mapped_column(Integer, nullable=False, index=True)
     edrpou: Mapped[str] = mapped_column(String(10), nullable=False, index=True)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow())
     
     __table_args__ = (
         UniqueConstraint('user_id', 'edrpou', name='uq_user_edrpou'),
+        # Subscriber fan-out per monitoring page; partial where supported (MySQL gets a full index)
+        Index('ix_user_sub_edrpou_active', 'edrpou', 'user_id',
+              sqlite_where=text('is_active = 1'), postgresql_where=text('is_active')),
     )
 
 
@@ -163,8 +241,8 @@ class UserSettings(Base):
     user_id: Mapped[int] = mapped_column(Integer, unique=True, nullable=False, index=True)
     # False = filter by Worksection (default), True = receive ALL notifications
     receive_all_notifications: Mapped[bool] = mapped_column(Boolean, default=False)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow(), onupdate=utcnow())
 
 
 class CaseSubscription(Base):
@@ -176,10 +254,12 @@ class CaseSubscription(Base):
     case_number: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
     case_name: Mapped[Optional[str]] = mapped_column(String(255))  # Optional description
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow())
     
     __table_args__ = (
         UniqueConstraint('user_id', 'case_number', name='uq_user_case'),
+        Index('ix_case_sub_case_active', 'case_number', 'user_id',
+              sqlite_where=text('is_active = 1'), postgresql_where=text('is_active')),
     )
 
 
@@ -191,8 +271,8 @@ class ApiResponseCache(Base):
     endpoint: Mapped[str] = mapped_column(String(80), nullable=False)  # full-company, clarity-edr-info, clarity-tax-info, etc.
     query_key: Mapped[str] = mapped_column(String(100), nullable=False)  # EDRPOU, PIB, INN, EDRPOU:period
     response_data: Mapped[str] = mapped_column(JSON, nullable=False)  # Full API response
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow(), onupdate=utcnow())
     hit_count: Mapped[int] = mapped_column(Integer, default=1)  # How many times this cache was used
     
     __table_args__ = (
@@ -209,8 +289,8 @@ class UserIdentity(Base):
     telegram_user_id: Mapped[int] = mapped_column(Integer, unique=True, nullable=False, index=True)
     full_name: Mapped[str] = mapped_column(String(255), nullable=False)  # ПІБ
     inn: Mapped[str] = mapped_column(String(10), nullable=False)  # ІПН
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow(), onupdate=utcnow())
 
 
 class BotUser(Base):
@@ -224,5 +304,5 @@ class BotUser(Base):
     contractor_access: Mapped[bool] = mapped_column(Boolean, default=False)
     contractor_access_requested: Mapped[bool] = mapped_column(Boolean, default=False)
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow())
+    updated_at: Mapped[datetime] = mapped_column(DateTime, default=utcnow(), onupdate=utcnow())
@@ -1,13 +1,23 @@
-from typing import List, Optional
+from collections import defaultdict
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime
-from sqlalchemy import select, update, delete
+from sqlalchemy import (
+    case, event, select, update, delete, distinct, exists, func, literal, or_, tuple_, union_all
+)
+from sqlalchemy.dialects.mysql import insert as mysql_insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
 from src.storage.models import (
     MonitoredCompany, OpenDataBotSubscription, WorksectionCase,
     CourtCase, NotificationSent, SyncState, UserSubscription,
-    UserSettings, CaseSubscription, BotUser
+    UserSettings, CaseSubscription, BotUser, json_array_contains, utcnow
 )
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
@@ -24,8 +34,7 @@ class CompanyRepository:
             is_active=True
         )
         self.session.add(company)
-        await self.session.commit()
-        await self.session.refresh(company)
+        await self.session.flush()
         return company
     
     async def get_company(self, edrpou: str) -> Optional[MonitoredCompany]:
@@ -34,39 +43,45 @@ class CompanyRepository:
         )
         return result.scalar_one_or_none()
     
+    async def get_companies_by_edrpous(self, edrpous: List[str]) -> Dict[str, MonitoredCompany]:
+        """Batch variant of get_company: one IN query instead of one SELECT per code."""
+        if not edrpous:
+            return {}
+        result = await self.session.scalars(
+            select(MonitoredCompany).where(MonitoredCompany.edrpou.in_(set(edrpous)))
+        )
+        return {c.edrpou: c for c in result}
+    
     async def get_active_companies(self) -> List[MonitoredCompany]:
-        result = await self.session.execute(
+        result = await self.session.scalars(
             select(MonitoredCompany).where(MonitoredCompany.is_active == True)
         )
-        return list(result.scalars().all())
+        return result.all()
     
     async def get_all_companies(self) -> List[MonitoredCompany]:
-        result = await self.session.execute(select(MonitoredCompany))
-        return list(result.scalars().all())
+        result = await self.session.scalars(select(MonitoredCompany))
+        return result.all()
     
     async def deactivate_company(self, edrpou: str) -> bool:
         result = await self.session.execute(
             update(MonitoredCompany)
             .where(MonitoredCompany.edrpou == edrpou)
-            .values(is_active=False, updated_at=datetime.utcnow())
+            .values(is_active=False, updated_at=utcnow())
         )
-        await self.session.commit()
         return result.rowcount > 0
     
     async def activate_company(self, edrpou: str) -> bool:
         result = await self.session.execute(
             update(MonitoredCompany)
             .where(MonitoredCompany.edrpou == edrpou)
-            .values(is_active=True, updated_at=datetime.utcnow())
+            .values(is_active=True, updated_at=utcnow())
         )
-        await self.session.commit()
         return result.rowcount > 0
     
     async def delete_company(self, edrpou: str) -> bool:
         result = await self.session.execute(
             delete(MonitoredCompany).where(MonitoredCompany.edrpou == edrpou)
         )
-        await self.session.commit()
         return result.rowcount > 0
 
 
@@ -85,22 +100,22 @@ class SubscriptionRepository:
             subscription_key=subscription_key or edrpou
         )
         self.session.add(sub)
-        await self.session.commit()
+        await self.session.flush()
         return sub
     
     async def get_subscriptions_by_edrpou(self, edrpou: str) -> List[OpenDataBotSubscription]:
-        result = await self.session.execute(
+        result = await self.session.scalars(
             select(OpenDataBotSubscription)
             .where(OpenDataBotSubscription.edrpou == edrpou)
             .where(OpenDataBotSubscription.is_active == True)
         )
-        return list(result.scalars().all())
+        return result.all()
     
     async def get_all_active_subscriptions(self) -> List[OpenDataBotSubscription]:
-        result = await self.session.execute(
+        result = await self.session.scalars(
             select(OpenDataBotSubscription).where(OpenDataBotSubscription.is_active == True)
         )
-        return list(result.scalars().all())
+        return result.all()
     
     async def deactivate_subscription(self, subscription_id: str) -> bool:
         result = await self.session.execute(
@@ -108,10 +123,91 @@ class SubscriptionRepository:
             .where(OpenDataBotSubscription.subscription_id == subscription_id)
             .values(is_active=False)
         )
-        await self.session.commit()
         return result.rowcount > 0
 
 
+_INSERTS = {
+    "mysql": mysql_insert,
+    "sqlite": sqlite_insert,
+    "postgresql": pg_insert,
+}
+
+
+@lru_cache(maxsize=64)
+def _upsert_stmt(
+    dialect: str, model: type, index_elements: Tuple[str, ...],
+    update_cols: Tuple[str, ...], stamp_cols: Tuple[str, ...],
+    stamp_if_changed: bool = False
+):
+    """
+    Row-independent INSERT ... ON CONFLICT / ON DUPLICATE KEY UPDATE for
+    executemany, or None when the dialect has no native upsert. Cached per
+    shape, so SQLAlchemy compiles each statement once.
+    
+    With stamp_if_changed, stamp columns only move when one of update_cols
+    actually gets a different value.
+    """
+    insert = _INSERTS.get(dialect)
+    if insert is None:
+        return None
+    stmt = insert(model)
+    new = stmt.inserted if dialect == "mysql" else stmt.excluded
+    table = model.__table__
+    if not stamp_if_changed:
+        stamps = [(c, utcnow()) for c in stamp_cols]
+    elif update_cols:
+        changed = or_(*(table.c[c].is_distinct_from(new[c]) for c in update_cols))
+        stamps = [(c, case((changed, utcnow()), else_=table.c[c])) for c in stamp_cols]
+    else:
+        # Nothing to update, but the conflict branch still has to SET something
+        stamps = [(c, table.c[c]) for c in stamp_cols]
+    # Stamps go first: MySQL applies assignments left to right, so a later
+    # comparison would already see the updated values
+    values = stamps + [(c, new[c]) for c in update_cols]
+    if dialect == "mysql":
+        return stmt.on_duplicate_key_update(values)
+    return stmt.on_conflict_do_update(index_elements=list(index_elements), set_=dict(values))
+
+
+@lru_cache(maxsize=16)
+def _insert_ignore_stmt(dialect: str, model, index_elements: Tuple[str, ...]):
+    """INSERT that skips rows hitting the unique key, or None without native support."""
+    if dialect == "mysql":
+        return mysql_insert(model).prefix_with("IGNORE")
+    insert = _INSERTS.get(dialect)
+    if insert is None:
+        return None
+    return insert(model).on_conflict_do_nothing(index_elements=list(index_elements))
+
+
+def _mark_stale(session: AsyncSession, cache: dict, key) -> None:
+    """
+    Record that this session wrote the value cached under key. The entry is
+    dropped once the session commits; until then reads on this session go
+    to the database, so an uncommitted value never reaches the cache.
+    """
+    session.info.setdefault('stale_cache_keys', []).append((cache, key))
+
+
+def _is_stale(session: AsyncSession, cache: dict, key) -> bool:
+    return any(
+        c is cache and k == key for c, k in session.info.get('stale_cache_keys', ())
+    )
+
+
+@event.listens_for(Session, 'after_commit')
+def _drop_stale_cache_keys(session: Session):
+    for cache, key in session.info.pop('stale_cache_keys', ()):
+        cache.pop(key, None)
+
+
+@event.listens_for(Session, 'after_soft_rollback')
+def _forget_stale_cache_keys(session: Session, previous_transaction):
+    # Savepoint rollbacks leave the outer transaction's writes pending
+    if previous_transaction.parent is None:
+        session.info.pop('stale_cache_keys', None)
+
+
 class WorksectionCaseRepository:
     def __init__(self, session: AsyncSession):
         self.session = session
@@ -142,22 +238,110 @@ class WorksectionCaseRepository:
             )
             self.session.add(case)
         
-        await self.session.commit()
+        await self.session.flush()
         return case
     
+    async def bulk_upsert_cases(self, rows: List[dict], batch_size: int = 500) -> int:
+        """
+        Insert or refresh many (case number, task) rows in batches.
+
+        Each batch is one executemany of a prebuilt INSERT ... ON CONFLICT /
+        ON DUPLICATE KEY UPDATE statement under its own savepoint. A failed
+        batch is rolled back to it and logged, the rest still go through.
+
+        Returns:
+            Number of rows written
+        """
+        # Last row wins per (case, task) — one statement must not hit a key twice
+        unique = list({
+            (r['normalized_case_number'], r['task_id']): r for r in rows
+        }.values())
+        stmt = _upsert_stmt(
+            self.session.bind.dialect.name, WorksectionCase,
+            ('normalized_case_number', 'task_id'),
+            ('raw_name', 'project_id', 'project_name'), ('synced_at',),
+        )
+        if stmt is None:
+            for r in unique:
+                await self.upsert_case(**r)
+            return len(unique)
+
+        written = 0
+        for start in range(0, len(unique), batch_size):
+            batch = unique[start:start + batch_size]
+            try:
+                async with self.session.begin_nested():
+                    await self.session.execute(stmt, batch)
+                written += len(batch)
+            except Exception as e:
+                logger.error(f"Error saving cases batch at {start}: {e}")
+        return written
+    
+    async def insert_new_cases(self, rows: List[dict]) -> int:
+        """
+        Insert rows whose (case number, task) pair is not stored yet,
+        ignoring the rest. One executemany — for sources like the Gist whose
+        metadata never changes.
+
+        Returns:
+            Number of rows inserted
+        """
+        if not rows:
+            return 0
+        # On the Table, not the entity: an ORM bulk insert has no rowcount
+        stmt = _insert_ignore_stmt(
+            self.session.bind.dialect.name, WorksectionCase.__table__,
+            ('normalized_case_number', 'task_id'),
+        )
+        if stmt is None:
+            return await self.bulk_upsert_cases(rows)
+        
+        result = await self.session.execute(stmt, rows)
+        return result.rowcount
+    
     async def case_exists(self, normalized_case_number: str) -> bool:
         result = await self.session.execute(
-            select(WorksectionCase.id)
-            .where(WorksectionCase.normalized_case_number == normalized_case_number)
-            .limit(1)
+            select(
+                exists()
+                .where(WorksectionCase.normalized_case_number == normalized_case_number)
+            )
         )
-        return result.scalar_one_or_none() is not None
+        return bool(result.scalar())
     
     async def get_all_case_numbers(self) -> List[str]:
-        result = await self.session.execute(
+        result = await self.session.scalars(
             select(WorksectionCase.normalized_case_number).distinct()
         )
-        return [r[0] for r in result.all()]
+        return result.all()
+    
+    async def count_case_numbers(self) -> int:
+        result = await self.session.execute(
+            select(func.count(distinct(WorksectionCase.normalized_case_number)))
+        )
+        return result.scalar_one()
+    
+    async def filter_new_case_numbers(self, candidates: List[str]) -> Set[str]:
+        """Return the candidates that are not in Worksection yet."""
+        candidates = set(candidates)
+        if not candidates:
+            return candidates
+        result = await self.session.scalars(
+            select(WorksectionCase.normalized_case_number)
+            .where(WorksectionCase.normalized_case_number.in_(candidates))
+            .distinct()
+        )
+        return candidates.difference(result)
+
+
+def _newest_first(stmt, before: Optional[Tuple[datetime, int]], limit: int):
+    """
+    Keyset page of court cases, newest first. ``before`` is the
+    (fetched_at, id) of the last case already shown; id breaks ties between
+    rows stamped by the same bulk upsert.
+    """
+    if before is not None:
+        stmt = stmt.where(tuple_(CourtCase.fetched_at, CourtCase.id) < tuple(before))
+    return stmt.order_by(CourtCase.fetched_at.desc(), CourtCase.id.desc()).limit(limit)
 
 
 class CourtCaseRepository:
@@ -184,9 +368,60 @@ class CourtCaseRepository:
             case = CourtCase(**case_data)
             self.session.add(case)
         
-        await self.session.commit()
+        await self.session.flush()
         return case
     
+    async def bulk_upsert_cases(self, rows: List[dict], batch_size: int = 1000) -> int:
+        """
+        Insert or refresh many court cases keyed on case_id, in batches.
+        
+        Like upsert_case, only the keys present in a row are written and
+        unknown keys are ignored; rows without case_id are plain inserts.
+        Rows are grouped by key set, since one executemany needs one
+        parameter shape. Each batch runs under its own savepoint; a failed
+        batch is rolled back to it and logged.
+        
+        Returns:
+            Number of rows written
+        """
+        columns = CourtCase.__table__.columns.keys()
+        # Rows for the same case_id are merged in order, as sequential
+        # upserts would leave them — one statement must not hit a key twice
+        keyed = {}
+        unkeyed = []
+        for row in rows:
+            row = {k: v for k, v in row.items() if k in columns}
+            if row.get('case_id'):
+                keyed[row['case_id']] = {**keyed.get(row['case_id'], {}), **row}
+            else:
+                unkeyed.append(row)
+        
+        groups = defaultdict(list)
+        for row in chain(keyed.values(), unkeyed):
+            groups[tuple(sorted(row))].append(row)
+        
+        dialect = self.session.bind.dialect.name
+        written = 0
+        for cols, group in groups.items():
+            stmt = _upsert_stmt(
+                dialect, CourtCase, ('case_id',),
+                tuple(c for c in cols if c != 'case_id'), ('fetched_at', 'updated_at'),
+            )
+            if stmt is None:
+                for row in group:
+                    await self.upsert_case(row)
+                written += len(group)
+                continue
+            for start in range(0, len(group), batch_size):
+                batch = group[start:start + batch_size]
+                try:
+                    async with self.session.begin_nested():
+                        await self.session.execute(stmt, batch)
+                    written += len(batch)
+                except Exception as e:
+                    logger.error(f"Error saving court cases batch at {start}: {e}")
+        return written
+    
     async def get_case(self, case_id: str = None, case_number: str = None) -> Optional[CourtCase]:
         if case_id:
             result = await self.session.execute(
@@ -200,48 +435,45 @@ class CourtCaseRepository:
             return None
         return result.scalar_one_or_none()
     
-    async def get_cases_by_threat_level(self, threat_level: str, limit: int = 10) -> List[CourtCase]:
-        result = await self.session.execute(
-            select(CourtCase)
-            .where(CourtCase.threat_level == threat_level)
-            .order_by(CourtCase.fetched_at.desc())
-            .limit(limit)
+    async def get_cases_by_threat_level(
+        self, threat_level: str, limit: int = 10, before: Optional[Tuple[datetime, int]] = None
+    ) -> List[CourtCase]:
+        result = await self.session.scalars(
+            _newest_first(select(CourtCase).where(CourtCase.threat_level == threat_level), before, limit)
         )
-        return list(result.scalars().all())
+        return result.all()
     
-    async def get_cases_by_status(self, status: str, limit: int = 10) -> List[CourtCase]:
-        result = await self.session.execute(
-            select(CourtCase)
-            .where(CourtCase.status == status)
-            .order_by(CourtCase.fetched_at.desc())
-            .limit(limit)
+    async def get_cases_by_status(
+        self, status: str, limit: int = 10, before: Optional[Tuple[datetime, int]] = None
+    ) -> List[CourtCase]:
+        result = await self.session.scalars(
+            _newest_first(select(CourtCase).where(CourtCase.status == status), before, limit)
         )
-        return list(result.scalars().all())
+        return result.all()
     
-    async def get_recent_cases(self, limit: int = 15) -> List[CourtCase]:
-        result = await self.session.execute(
-            select(CourtCase)
-            .order_by(CourtCase.fetched_at.desc())
-            .limit(limit)
+    async def get_recent_cases(
+        self, limit: int = 15, before: Optional[Tuple[datetime, int]] = None
+    ) -> List[CourtCase]:
+        result = await self.session.scalars(
+            _newest_first(select(CourtCase), before, limit)
         )
-        return list(result.scalars().all())
+        return result.all()
     
     async def get_cases_by_edrpou(self, edrpou: str, limit: int = 20) -> List[CourtCase]:
-        result = await self.session.execute(
+        result = await self.session.scalars(
             select(CourtCase)
-            .where(CourtCase.edrpou_matches.contains(edrpou))
+            .where(json_array_contains(CourtCase.edrpou_matches, edrpou))
             .order_by(CourtCase.fetched_at.desc())
             .limit(limit)
         )
-        return list(result.scalars().all())
+        return result.all()
     
     async def update_case_status(self, case_id: str, status: str) -> bool:
         result = await self.session.execute(
             update(CourtCase)
             .where(CourtCase.case_id == case_id)
-            .values(status=status, updated_at=datetime.utcnow())
+            .values(status=status, updated_at=utcnow())
         )
-        await self.session.commit()
         return result.rowcount > 0
     
     async def mark_in_worksection(self, case_number: str, task_id: str = None) -> bool:
@@ -252,10 +484,9 @@ class CourtCaseRepository:
                 is_in_worksection=True,
                 worksection_task_id=task_id,
                 status="in_worksection",
-                updated_at=datetime.utcnow()
+                updated_at=utcnow()
             )
         )
-        await self.session.commit()
         return result.rowcount > 0
 
 
@@ -265,11 +496,12 @@ class NotificationRepository:
     
     async def notification_sent(self, case_key: str) -> bool:
         result = await self.session.execute(
-            select(NotificationSent.id)
-            .where(NotificationSent.case_key == case_key)
-            .limit(1)
+            select(
+                exists()
+                .where(NotificationSent.case_key == case_key)
+            )
         )
-        return result.scalar_one_or_none() is not None
+        return bool(result.scalar())
     
     async def add_notification(
         self, case_key: str, normalized_case_number: str = None,
@@ -285,16 +517,39 @@ class NotificationRepository:
             payload_hash=payload_hash
         )
         self.session.add(notification)
-        await self.session.commit()
+        await self.session.flush()
         return notification
     
+    async def add_notifications(self, rows: List[dict]) -> int:
+        """Record a batch of sent notifications in one INSERT.
+        
+        Keys that are already recorded are skipped rather than failing the batch.
+        """
+        if not rows:
+            return 0
+        stmt = _insert_ignore_stmt(
+            self.session.bind.dialect.name, NotificationSent, ('case_key',)
+        )
+        if stmt is None:
+            stmt = NotificationSent.__table__.insert()
+        await self.session.execute(stmt, rows)
+        await self.session.flush()
+        return len(rows)
+    
     async def get_recent_notifications(self, limit: int = 10) -> List[NotificationSent]:
-        result = await self.session.execute(
+        result = await self.session.scalars(
             select(NotificationSent)
             .order_by(NotificationSent.sent_at.desc())
             .limit(limit)
         )
-        return list(result.scalars().all())
+        return result.all()
+
+
+# Sync cursors: key → (expires_at, value). Only the sync workers in this
+# process write them, so a read-through cache is safe; set_state drops the
+# key after its transaction commits, since get_uow() may still roll back.
+_STATE_TTL = 300.0
+_state_cache: Dict[str, Tuple[float, Optional[str]]] = {}
 
 
 class SyncStateRepository:
@@ -302,13 +557,30 @@ class SyncStateRepository:
         self.session = session
     
     async def get_state(self, key: str) -> Optional[str]:
+        stale = _is_stale(self.session, _state_cache, key)
+        now = time.monotonic()
+        cached = _state_cache.get(key)
+        if cached and cached[0] > now and not stale:
+            return cached[1]
+        
         result = await self.session.execute(
             select(SyncState.value).where(SyncState.key_name == key)
         )
         row = result.scalar_one_or_none()
+        if not stale:
+            _state_cache[key] = (now + _STATE_TTL, row)
         return row
     
     async def set_state(self, key: str, value: str):
+        _mark_stale(self.session, _state_cache, key)
+        stmt = _upsert_stmt(
+            self.session.bind.dialect.name, SyncState,
+            ('key_name',), ('value',), ('updated_at',),
+        )
+        if stmt is not None:
+            await self.session.execute(stmt, [{'key_name': key, 'value': value}])
+            return
+        
         existing = await self.session.execute(
             select(SyncState).where(SyncState.key_name == key)
         )
@@ -321,7 +593,7 @@ class SyncStateRepository:
             state = SyncState(key_name=key, value=value)
             self.session.add(state)
         
-        await self.session.commit()
+        await self.session.flush()
 
 
 class UserSubscriptionRepository:
@@ -344,7 +616,7 @@ class UserSubscriptionRepository:
             sub = UserSubscription(user_id=user_id, edrpou=edrpou, is_active=True)
             self.session.add(sub)
         
-        await self.session.commit()
+        await self.session.flush()
         return sub
     
     async def unsubscribe(self, user_id: int, edrpou: str) -> bool:
@@ -355,26 +627,34 @@ class UserSubscriptionRepository:
             .where(UserSubscription.edrpou == edrpou)
             .values(is_active=False)
         )
-        await self.session.commit()
         return result.rowcount > 0
     
     async def get_user_subscriptions(self, user_id: int) -> List[UserSubscription]:
         """Get all active subscriptions for a user"""
-        result = await self.session.execute(
+        result = await self.session.scalars(
             select(UserSubscription)
             .where(UserSubscription.user_id == user_id)
             .where(UserSubscription.is_active == True)
         )
-        return list(result.scalars().all())
+        return result.all()
+    
+    async def get_user_edrpous(self, user_id: int) -> List[str]:
+        """EDRPOUs of a user's active subscriptions, without loading full rows"""
+        result = await self.session.scalars(
+            select(UserSubscription.edrpou)
+            .where(UserSubscription.user_id == user_id)
+            .where(UserSubscription.is_active == True)
+        )
+        return result.all()
     
     async def get_users_for_edrpou(self, edrpou: str) -> List[int]:
         """Get all user IDs subscribed to this EDRPOU"""
-        result = await self.session.execute(
+        result = await self.session.scalars(
             select(UserSubscription.user_id)
             .where(UserSubscription.edrpou == edrpou)
             .where(UserSubscription.is_active == True)
         )
-        return [r[0] for r in result.all()]
+        return result.all()
     
     async def get_subscription(self, user_id: int, edrpou: str) -> Optional[UserSubscription]:
         """Get specific subscription"""
@@ -388,13 +668,14 @@ class UserSubscriptionRepository:
     async def is_subscribed(self, user_id: int, edrpou: str) -> bool:
         """Check if user is subscribed to company"""
         result = await self.session.execute(
-            select(UserSubscription.id)
-            .where(UserSubscription.user_id == user_id)
-            .where(UserSubscription.edrpou == edrpou)
-            .where(UserSubscription.is_active == True)
-            .limit(1)
+            select(
+                exists()
+                .where(UserSubscription.user_id == user_id)
+                .where(UserSubscription.edrpou == edrpou)
+                .where(UserSubscription.is_active == True)
+            )
         )
-        return result.scalar_one_or_none() is not None
+        return bool(result.scalar())
 
 
 class UserSettingsRepository:
@@ -412,24 +693,34 @@ class UserSettingsRepository:
     async def get_or_create(self, user_id: int) -> UserSettings:
         """Get or create user settings"""
         settings = await self.get_settings(user_id)
-        if not settings:
+        if settings:
+            return settings
+        
+        stmt = _insert_ignore_stmt(self.session.bind.dialect.name, UserSettings, ('user_id',))
+        if stmt is None:
             settings = UserSettings(user_id=user_id)
             self.session.add(settings)
-            await self.session.commit()
-            await self.session.refresh(settings)
-        return settings
+            await self.session.flush()
+            return settings
+        
+        # Insert-or-ignore: a concurrent first access can't raise IntegrityError
+        await self.session.execute(stmt, [{'user_id': user_id}])
+        return await self.get_settings(user_id)
     
     async def set_receive_all(self, user_id: int, value: bool) -> UserSettings:
         """Set receive_all_notifications preference"""
         settings = await self.get_or_create(user_id)
         settings.receive_all_notifications = value
-        await self.session.commit()
+        await self.session.flush()
         return settings
     
     async def get_receive_all(self, user_id: int) -> bool:
         """Check if user wants to receive all notifications"""
-        settings = await self.get_settings(user_id)
-        return settings.receive_all_notifications if settings else False
+        result = await self.session.execute(
+            select(UserSettings.receive_all_notifications)
+            .where(UserSettings.user_id == user_id)
+        )
+        return result.scalar_one_or_none() is True
 
 
 class CaseSubscriptionRepository:
@@ -459,7 +750,7 @@ class CaseSubscriptionRepository:
             )
             self.session.add(sub)
         
-        await self.session.commit()
+        await self.session.flush()
         return sub
     
     async def unsubscribe(self, user_id: int, case_number: str) -> bool:
@@ -470,37 +761,84 @@ class CaseSubscriptionRepository:
             .where(CaseSubscription.case_number == case_number)
             .values(is_active=False)
         )
-        await self.session.commit()
         return result.rowcount > 0
     
     async def get_user_cases(self, user_id: int) -> List[CaseSubscription]:
         """Get all active case subscriptions for a user"""
-        result = await self.session.execute(
+        result = await self.session.scalars(
             select(CaseSubscription)
             .where(CaseSubscription.user_id == user_id)
             .where(CaseSubscription.is_active == True)
         )
-        return list(result.scalars().all())
+        return result.all()
     
     async def get_users_for_case(self, case_number: str) -> List[int]:
         """Get all user IDs subscribed to this case number"""
-        result = await self.session.execute(
+        result = await self.session.scalars(
             select(CaseSubscription.user_id)
             .where(CaseSubscription.case_number == case_number)
             .where(CaseSubscription.is_active == True)
         )
-        return [r[0] for r in result.all()]
+        return result.all()
     
     async def is_subscribed(self, user_id: int, case_number: str) -> bool:
         """Check if user is subscribed to a case"""
         result = await self.session.execute(
-            select(CaseSubscription.id)
-            .where(CaseSubscription.user_id == user_id)
-            .where(CaseSubscription.case_number == case_number)
-            .where(CaseSubscription.is_active == True)
-            .limit(1)
+            select(
+                exists()
+                .where(CaseSubscription.user_id == user_id)
+                .where(CaseSubscription.case_number == case_number)
+                .where(CaseSubscription.is_active == True)
+            )
         )
-        return result.scalar_one_or_none() is not None
+        return bool(result.scalar())
+
+
+class DispatchRepository:
+    """Who gets notified about a page of court events, in one query"""
+    def __init__(self, session: AsyncSession):
+        self.session = session
+    
+    async def get_page_subscribers(
+        self, edrpous: List[str], case_numbers: List[str]
+    ) -> Tuple[Dict[str, List[int]], Dict[str, List[int]], Set[int]]:
+        """
+        Active company and case subscribers plus their notification filter.
+        
+        Returns (users by EDRPOU, users by case number, ids of users with
+        receive_all_notifications). Replaces one get_receive_all() per user.
+        """
+        users_by_edrpou = defaultdict(list)
+        users_by_case = defaultdict(list)
+        receive_all = set()
+        if not edrpous and not case_numbers:
+            return users_by_edrpou, users_by_case, receive_all
+        
+        subs = union_all(
+            select(literal('edrpou').label('kind'), UserSubscription.edrpou.label('key'), UserSubscription.user_id)
+            .where(UserSubscription.edrpou.in_(edrpous))
+            .where(UserSubscription.is_active == True),
+            select(literal('case'), CaseSubscription.case_number, CaseSubscription.user_id)
+            .where(CaseSubscription.case_number.in_(case_numbers))
+            .where(CaseSubscription.is_active == True),
+        ).subquery()
+        result = await self.session.execute(
+            select(subs.c.kind, subs.c.key, subs.c.user_id, UserSettings.receive_all_notifications)
+            .outerjoin(UserSettings, UserSettings.user_id == subs.c.user_id)
+        )
+        for kind, key, user_id, wants_all in result.all():
+            (users_by_edrpou if kind == 'edrpou' else users_by_case)[key].append(user_id)
+            if wants_all:
+                receive_all.add(user_id)
+        return users_by_edrpou, users_by_case, receive_all
+
+
+# Contractor-access answers per telegram user: user_id → (expires_at, granted).
+# Checked on most bot updates and changed rarely, so a short TTL is enough;
+# set_contractor_access drops the entry of the user it changes on commit.
+_ACCESS_TTL = 60.0
+_ACCESS_CACHE_MAX = 10_000
+_access_cache: Dict[int, Tuple[float, bool]] = {}
 
 
 class BotUserRepository:
@@ -510,6 +848,24 @@ class BotUserRepository:
     
     async def get_or_create(self, telegram_user_id: int, username: str = None, full_name: str = None) -> BotUser:
         """Get or create bot user on /start"""
+        profile = {'username': username, 'full_name': full_name}
+        # Only overwrite profile fields we were given, as the fallback below does
+        stmt = _upsert_stmt(
+            self.session.bind.dialect.name, BotUser, ('telegram_user_id',),
+            tuple(c for c, v in profile.items() if v), ('updated_at',),
+            stamp_if_changed=True,
+        )
+        if stmt is not None and self.session.bind.dialect.insert_returning:
+            # One round trip: upsert and read the row back via RETURNING
+            result = await self.session.execute(
+                stmt.values(
+                    telegram_user_id=telegram_user_id, **profile,
+                    contractor_access=False, contractor_access_requested=False, is_active=True,
+                ).returning(BotUser),
+                execution_options={'populate_existing': True},
+            )
+            return result.scalar_one()
+        
         result = await self.session.execute(
             select(BotUser).where(BotUser.telegram_user_id == telegram_user_id)
         )
@@ -525,7 +881,7 @@ class BotUserRepository:
                 user.full_name = full_name
                 changed = True
             if changed:
-                await self.session.commit()
+                await self.session.flush()
             return user
         
         user = BotUser(
@@ -537,8 +893,7 @@ class BotUserRepository:
             is_active=True
         )
         self.session.add(user)
-        await self.session.commit()
-        await self.session.refresh(user)
+        await self.session.flush()
         return user
     
     async def get_user(self, telegram_user_id: int) -> Optional[BotUser]:
@@ -550,12 +905,23 @@ class BotUserRepository:
     
     async def has_contractor_access(self, telegram_user_id: int) -> bool:
         """Check if user has contractor check access"""
+        stale = _is_stale(self.session, _access_cache, telegram_user_id)
+        now = time.monotonic()
+        cached = _access_cache.get(telegram_user_id)
+        if cached and cached[0] > now and not stale:
+            return cached[1]
+        
         result = await self.session.execute(
             select(BotUser.contractor_access)
             .where(BotUser.telegram_user_id == telegram_user_id)
         )
-        row = result.scalar_one_or_none()
-        return row is True
+        granted = result.scalar_one_or_none() is True
+        if stale:
+            return granted
+        if len(_access_cache) >= _ACCESS_CACHE_MAX:
+            _access_cache.clear()
+        _access_cache[telegram_user_id] = (now + _ACCESS_TTL, granted)
+        return granted
     
     async def set_contractor_access(self, telegram_user_id: int, granted: bool) -> bool:
         """Grant or revoke contractor access"""
@@ -564,7 +930,7 @@ class BotUserRepository:
             .where(BotUser.telegram_user_id == telegram_user_id)
             .values(contractor_access=granted, contractor_access_requested=False)
         )
-        await self.session.commit()
+        _mark_stale(self.session, _access_cache, telegram_user_id)
         return result.rowcount > 0
     
     async def set_access_requested(self, telegram_user_id: int) -> bool:
@@ -574,12 +940,11 @@ class BotUserRepository:
             .where(BotUser.telegram_user_id == telegram_user_id)
             .values(contractor_access_requested=True)
         )
-        await self.session.commit()
         return result.rowcount > 0
     
     async def get_all_users(self) -> List[BotUser]:
         """Get all bot users"""
-        result = await self.session.execute(
+        result = await self.session.scalars(
             select(BotUser).order_by(BotUser.created_at)
         )
-        return list(result.scalars().all())
+        return result.all()
@@ -1,8 +1,19 @@
 import re
-from typing import Optional, List
+from functools import lru_cache
+from typing import Optional, List, Pattern
 from src.config import settings
 
 
+# Leading "№"/"#"/whitespace, then an optional "справа" word
+_CLEAN_RE = re.compile(r'^[№#\s]*(?:справа\s*)?', re.IGNORECASE)
+
+
+@lru_cache(maxsize=8)
+def _case_pattern(pattern: str) -> Pattern:
+    """Compiled case-number regex, keyed by the configured pattern string."""
+    return re.compile(pattern)
+
+
 def normalize_case_number(raw: str) -> Optional[str]:
     """
     Normalize court case number to canonical format.
@@ -14,14 +25,11 @@ def normalize_case_number(raw: str) -> Optional[str]:
     if not raw:
         return None
     
-    # Remove common prefixes and clean up
-    cleaned = raw.strip()
-    cleaned = re.sub(r'^[№#\s]+', '', cleaned)
-    cleaned = re.sub(r'^справа\s*', '', cleaned, flags=re.IGNORECASE)
+    # Remove common prefixes (one pass)
+    cleaned = _CLEAN_RE.sub('', raw, count=1)
     
     # Extract case number pattern
-    pattern = settings.WORKSECTION_CASE_PATTERN
-    match = re.search(pattern, cleaned)
+    match = _case_pattern(settings.WORKSECTION_CASE_PATTERN).search(cleaned)
     
     if match:
         return match.group(1)
@@ -36,18 +44,10 @@ def extract_case_numbers(text: str) -> List[str]:
     if not text:
         return []
     
-    pattern = settings.WORKSECTION_CASE_PATTERN
-    matches = re.findall(pattern, text)
+    matches = _case_pattern(settings.WORKSECTION_CASE_PATTERN).findall(text)
     
     # Deduplicate while preserving order
-    seen = set()
-    result = []
-    for m in matches:
-        if m not in seen:
-            seen.add(m)
-            result.append(m)
-    
-    return result
+    return list(dict.fromkeys(matches))
 
 
 def generate_case_key(case_id: str = None, case_number: str = None, court_code: str = None) -> str:
@@ -77,14 +77,12 @@ def validate_edrpou(edrpou: str) -> bool:
     
     cleaned = edrpou.strip()
     
-    # Must be 8 digits
-    if not re.match(r'^\d{8}$', cleaned):
-        return False
-    
-    return True
+    # Must be 8 digits (isdecimal() is the same class as regex \d)
+    return len(cleaned) == 8 and cleaned.isdecimal()
 
 
 def format_edrpou(edrpou: str) -> str:
     """Format EDRPOU to standard 8-digit format."""
-    cleaned = re.sub(r'\D', '', edrpou)
-    return cleaned.zfill(8)
+    if edrpou.isdecimal():
+        return edrpou.zfill(8)
+    return ''.join(filter(str.isdecimal, edrpou)).zfill(8)